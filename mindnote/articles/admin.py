@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.admin import register
 
-from articles.models import Article, Note, Connection
+from articles.models import Article, Note, Connection, Tombstone
 
 
 @register(Article)
@@ -17,3 +17,8 @@ class NoteAdmin(admin.ModelAdmin):
 @register(Connection)
 class ConnectionAdmin(admin.ModelAdmin):
     pass
+
+
+@register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    pass
@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from commons.caches import LRUCache
+
+
+class ArticleCache(ABC):
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if ArticleCache._instance is None:
+            options = settings.ARTICLE_CACHE
+
+            if options['BACKEND'] == 'django':
+                ArticleCache._instance = ArticleCacheWithDjangoCache(options)
+            elif options['BACKEND'] == 'file':
+                ArticleCache._instance = ArticleCacheWithFile(options)
+            else:
+                ArticleCache._instance = ArticleCacheWithLocalMemory(options)
+
+        return ArticleCache._instance
+
+    @classmethod
+    def reset(cls):
+        ArticleCache._instance = None
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, article_id, version):
+        entry = self.get_entry(article_id)
+
+        if entry is None or entry['version'] != version:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry['data']
+
+    def set(self, article_id, version, data):
+        self.set_entry(article_id, {'version': version, 'data': data})
+
+    def invalidate(self, article_id):
+        self.invalidations += 1
+        self.delete_entry(article_id)
+
+    def metrics(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    @property
+    def evictions(self):
+        return None
+
+    @abstractmethod
+    def get_entry(self, article_id):
+        pass
+
+    @abstractmethod
+    def set_entry(self, article_id, entry):
+        pass
+
+    @abstractmethod
+    def delete_entry(self, article_id):
+        pass
+
+
+class ArticleCacheWithLocalMemory(ArticleCache):
+    def __init__(self, options):
+        super().__init__()
+        self.cache = LRUCache(max_size=options['MAX_SIZE'], timeout=options['TIMEOUT'])
+
+    @property
+    def evictions(self):
+        return self.cache.evictions
+
+    def get_entry(self, article_id):
+        return self.cache.get(article_id)
+
+    def set_entry(self, article_id, entry):
+        self.cache.set(article_id, entry)
+
+    def delete_entry(self, article_id):
+        self.cache.delete(article_id)
+
+
+class ArticleCacheWithDjangoCache(ArticleCache):
+    KEY_PREFIX = 'article'
+
+    def __init__(self, options):
+        super().__init__()
+        self.cache = self.get_cache(options)
+        self.timeout = options['TIMEOUT']
+
+    def get_cache(self, options):
+        return caches[options['CACHE_ALIAS']]
+
+    def get_entry(self, article_id):
+        return self.cache.get(self._get_cache_key(article_id))
+
+    def set_entry(self, article_id, entry):
+        self.cache.set(self._get_cache_key(article_id), entry, self.timeout)
+
+    def delete_entry(self, article_id):
+        self.cache.delete(self._get_cache_key(article_id))
+
+    def _get_cache_key(self, article_id):
+        return f'{self.KEY_PREFIX}:{article_id}'
+
+
+class ArticleCacheWithFile(ArticleCacheWithDjangoCache):
+    def get_cache(self, options):
+        return FileBasedCache(options['LOCATION'], {
+            'TIMEOUT': options['TIMEOUT'],
+            'OPTIONS': {'MAX_ENTRIES': options['MAX_SIZE']},
+        })
+
+
+@receiver(setting_changed)
+def reset_article_cache(setting, **kwargs):
+    if setting == 'ARTICLE_CACHE':
+        ArticleCache.reset()
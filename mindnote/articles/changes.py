@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, signals
+from django.utils import timezone
+
+from articles.caches import ArticleCache
+from articles.counters import record_article_activity
+from articles.models import Article, Note, Connection, Tombstone
+
+
+@transaction.atomic()
+def delete_graph_objects(article_id, note_ids=(), connection_ids=()):
+    connection_ids = set(connection_ids)
+    if note_ids:
+        connection_ids.update(Connection.objects.filter(
+            Q(left_note_id__in=note_ids) | Q(right_note_id__in=note_ids),
+        ).values_list('id', flat=True))
+
+    Tombstone.objects.bulk_create([
+        *(Tombstone(article_id=article_id, model_name=Tombstone.ModelName.CONNECTION, object_id=connection_id)
+          for connection_id in connection_ids),
+        *(Tombstone(article_id=article_id, model_name=Tombstone.ModelName.NOTE, object_id=note_id)
+          for note_id in note_ids),
+    ])
+
+    deleted_connection_count = deleted_note_count = 0
+    if connection_ids:
+        deleted_connection_count, _ = Connection.objects.filter(article_id=article_id, id__in=connection_ids).delete()
+    if note_ids:
+        _, deleted_counts = Note.objects.filter(article_id=article_id, id__in=note_ids).delete()
+        deleted_note_count = deleted_counts.get(Note._meta.label, 0)
+
+    record_article_activity(article_id, note_count=-deleted_note_count, connection_count=-deleted_connection_count,
+                            updated_at=timezone.now())
+    ArticleCache.instance().invalidate(article_id)
+
+
+def _delete_without_collecting(queryset, deleted_models):
+    # the collector loads every note to cascade into connections which are already deleted, so skip it as long as
+    # every relation to the model is one of deleted_models and nothing listens to delete signals
+    model = queryset.model
+    related_models = {relation.related_model for relation in model._meta.related_objects}
+    if related_models <= deleted_models and not (
+        signals.pre_delete.has_listeners(model) or signals.post_delete.has_listeners(model)
+    ):
+        return queryset._raw_delete(queryset.db)
+
+    deleted_count, _ = queryset.delete()
+    return deleted_count
+
+
+@transaction.atomic()
+def delete_articles(article_ids):
+    article_ids = list(article_ids)
+    if not article_ids:
+        return 0
+
+    Connection.objects.filter(article_id__in=article_ids).delete()
+    Tombstone.objects.filter(article_id__in=article_ids).delete()
+    _delete_without_collecting(Note.objects.filter(article_id__in=article_ids), deleted_models={Connection})
+    deleted_count = _delete_without_collecting(
+        Article.objects.filter(id__in=article_ids), deleted_models={Connection, Tombstone, Note},
+    )
+
+    article_cache = ArticleCache.instance()
+    for article_id in article_ids:
+        article_cache.invalidate(article_id)
+
+    return deleted_count
+
+
+def get_changes_retained_since():
+    return timezone.now() - timedelta(seconds=settings.ARTICLE_CHANGES['RETENTION'])
+
+
+def purge_tombstones(batch_size):
+    queryset = Tombstone.objects.filter(created_at__lt=get_changes_retained_since()).order_by('id')
+
+    purged_count = 0
+    while True:
+        batch_ids = list(queryset.values_list('id', flat=True)[:batch_size])
+        if not batch_ids:
+            return purged_count
+
+        deleted_count, _ = Tombstone.objects.filter(id__in=batch_ids).delete()
+        purged_count += deleted_count
+
+
+def get_article_changes(article, since):
+    until = timezone.now()
+
+    deleted_ids = {model_name: [] for model_name in Tombstone.ModelName.values}
+    for model_name, object_id in Tombstone.objects.filter(
+        article=article, created_at__gte=since,
+    ).order_by().values_list('model_name', 'object_id'):
+        deleted_ids[model_name].append(object_id)
+
+    return {
+        'notes': Note.objects.filter(article=article, updated_at__gte=since),
+        'connections': Connection.objects.filter(article=article, updated_at__gte=since),
+        'deleted_notes': deleted_ids[Tombstone.ModelName.NOTE],
+        'deleted_connections': deleted_ids[Tombstone.ModelName.CONNECTION],
+        'until': until,
+    }
@@ -0,0 +1,47 @@
+from django.db.models import F, Q, Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from articles.models import Article, Note, Connection
+
+
+def record_article_activity(article_id, note_count=0, connection_count=0, **fields):
+    Article.objects.filter(id=article_id).update(
+        note_count=F('note_count') + note_count,
+        connection_count=F('connection_count') + connection_count,
+        last_activity_at=timezone.now(),
+        **fields,
+    )
+
+
+def _aggregate_subquery(model, aggregate):
+    return Subquery(
+        model.objects.filter(article=OuterRef('pk')).order_by().values('article')
+        .annotate(value=aggregate).values('value')
+    )
+
+
+def get_article_counters():
+    return {
+        'note_count': Coalesce(_aggregate_subquery(Note, Count('id')), 0),
+        'connection_count': Coalesce(_aggregate_subquery(Connection, Count('id')), 0),
+        'last_activity_at': Greatest(
+            'updated_at',
+            Coalesce(_aggregate_subquery(Note, Max('updated_at')), 'updated_at'),
+            Coalesce(_aggregate_subquery(Connection, Max('updated_at')), 'updated_at'),
+        ),
+    }
+
+
+def repair_article_counters(queryset):
+    counters = get_article_counters()
+    drifted_ids = queryset.annotate(
+        actual_note_count=counters['note_count'],
+        actual_connection_count=counters['connection_count'],
+    ).filter(
+        ~Q(note_count=F('actual_note_count'))
+        | ~Q(connection_count=F('actual_connection_count'))
+        | Q(last_activity_at__isnull=True)
+    ).values_list('id', flat=True)
+
+    return Article.objects.filter(id__in=list(drifted_ids)).update(**counters)
@@ -0,0 +1,153 @@
+import numpy as np
+from django.conf import settings
+from django.utils.functional import cached_property
+
+from articles.models import Note, Connection
+from commons.caches import LRUCache
+
+
+def get_graph_payload(article):
+    note_ids = []
+    note_contents = []
+    for note_id, contents in Note.objects.filter(article=article).values_list('id', 'contents'):
+        note_ids.append(note_id)
+        note_contents.append(contents)
+
+    note_indexes = {note_id: index for index, note_id in enumerate(note_ids)}
+
+    connection_ids = []
+    connection_pairs = []
+    connection_reasons = []
+    connection_rows = Connection.objects.filter(article=article).values_list(
+        'id', 'left_note_id', 'right_note_id', 'reason',
+    )
+    for connection_id, left_note_id, right_note_id, reason in connection_rows:
+        # skip connections to notes committed after the notes were read
+        if left_note_id not in note_indexes or right_note_id not in note_indexes:
+            continue
+
+        connection_ids.append(connection_id)
+        connection_pairs.append((note_indexes[left_note_id], note_indexes[right_note_id]))
+        connection_reasons.append(reason)
+
+    return {
+        'id': article.id,
+        'note_ids': note_ids,
+        'note_contents': note_contents,
+        'connection_ids': connection_ids,
+        'connection_pairs': connection_pairs,
+        'connection_reasons': connection_reasons,
+    }
+
+
+class ArticleGraph:
+    _cache = None
+
+    def __init__(self, note_ids, edges):
+        self.note_ids = np.asarray(note_ids, dtype=np.int64)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        edges = edges[np.isin(edges, self.note_ids).all(axis=1)]
+
+        left = np.searchsorted(self.note_ids, edges[:, 0])
+        right = np.searchsorted(self.note_ids, edges[:, 1])
+        sources = np.concatenate([left, right])
+        targets = np.concatenate([right, left])
+
+        self.indices = targets[np.argsort(sources, kind='stable')]
+        self.indptr = np.zeros(len(self.note_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(self.note_ids)), out=self.indptr[1:])
+
+    @classmethod
+    def load(cls, article):
+        note_ids = Note.objects.filter(article=article).order_by('id').values_list('id', flat=True)
+        edges = Connection.objects.filter(article=article).order_by().values_list('left_note_id', 'right_note_id')
+
+        return cls(list(note_ids), list(edges))
+
+    @classmethod
+    def cache(cls):
+        if ArticleGraph._cache is None:
+            options = settings.ARTICLE_GRAPH_CACHE
+            ArticleGraph._cache = LRUCache(max_size=options['MAX_SIZE'], timeout=options['TIMEOUT'])
+
+        return ArticleGraph._cache
+
+    @classmethod
+    def for_article(cls, article, version):
+        cached = cls.cache().get(article.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        graph = cls.load(article)
+        cls.cache().set(article.id, (version, graph))
+
+        return graph
+
+    @cached_property
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    @cached_property
+    def component_labels(self):
+        sources = np.repeat(np.arange(len(self.note_ids)), self.degrees)
+        labels = np.arange(len(self.note_ids))
+
+        while True:
+            next_labels = labels.copy()
+            np.minimum.at(next_labels, sources, labels[self.indices])
+            next_labels = next_labels[next_labels]
+            if np.array_equal(next_labels, labels):
+                return labels
+            labels = next_labels
+
+    def has_note(self, note_id):
+        index = np.searchsorted(self.note_ids, note_id)
+        return index < len(self.note_ids) and self.note_ids[index] == note_id
+
+    def degree_ranking(self, limit=None):
+        order = np.lexsort((self.note_ids, -self.degrees))[:limit]
+
+        return [
+            {'note': int(note_id), 'degree': int(degree)}
+            for note_id, degree in zip(self.note_ids[order], self.degrees[order])
+        ]
+
+    def components(self):
+        if not len(self.note_ids):
+            return []
+
+        _, inverse, sizes = np.unique(self.component_labels, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind='stable')
+        groups = np.split(self.note_ids[order], np.cumsum(sizes)[:-1])
+
+        return sorted((group.tolist() for group in groups), key=lambda group: (-len(group), group[0]))
+
+    def orphans(self):
+        return self.note_ids[self.degrees == 0].tolist()
+
+    def shortest_path(self, source_note_id, target_note_id):
+        source = np.searchsorted(self.note_ids, source_note_id)
+        target = np.searchsorted(self.note_ids, target_note_id)
+        parents = np.full(len(self.note_ids), -1, dtype=np.int64)
+        parents[source] = source
+        frontier = np.array([source])
+
+        while len(frontier) and parents[target] == -1:
+            counts = self.degrees[frontier]
+            offsets = np.repeat(self.indptr[frontier] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            neighbors = self.indices[offsets]
+            via = np.repeat(frontier, counts)
+
+            unvisited = parents[neighbors] == -1
+            neighbors, first_indexes = np.unique(neighbors[unvisited], return_index=True)
+            parents[neighbors] = via[unvisited][first_indexes]
+            frontier = neighbors
+
+        if parents[target] == -1:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+
+        return self.note_ids[path[::-1]].tolist()
@@ -0,0 +1,199 @@
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from articles.caches import ArticleCache
+from articles.models import Note
+
+NODE_DISTANCE = 120.0
+FULL_ITERATIONS = 50
+INCREMENTAL_ITERATIONS = 15
+GRID_SIZE = 16
+
+
+def _spanning_tree(graph, root):
+    parents = np.full(len(graph.note_ids), -1, dtype=np.int64)
+    parents[root] = root
+    levels = [np.array([root])]
+
+    while True:
+        frontier = levels[-1]
+        counts = graph.degrees[frontier]
+        offsets = np.repeat(graph.indptr[frontier] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        neighbors = graph.indices[offsets]
+        via = np.repeat(frontier, counts)
+
+        unvisited = parents[neighbors] == -1
+        neighbors, first_indexes = np.unique(neighbors[unvisited], return_index=True)
+        if not len(neighbors):
+            return parents, levels
+
+        parents[neighbors] = via[unvisited][first_indexes]
+        levels.append(neighbors)
+
+
+def _radial_component(graph, nodes, positions):
+    root = nodes[np.argmax(graph.degrees[nodes])]
+    parents, levels = _spanning_tree(graph, root)
+
+    weights = np.zeros(len(graph.note_ids))
+    children_weights = np.zeros(len(graph.note_ids))
+    for level in reversed(levels):
+        weights[level] = np.where(children_weights[level] > 0, children_weights[level], 1)
+        if level is not levels[0]:
+            np.add.at(children_weights, parents[level], weights[level])
+
+    starts = np.zeros(len(graph.note_ids))
+    spans = np.zeros(len(graph.note_ids))
+    spans[root] = 2 * np.pi
+    radius = 0.0
+    for level in levels[1:]:
+        radius = max(radius + NODE_DISTANCE, len(level) * NODE_DISTANCE / (2 * np.pi))
+        level = level[np.argsort(parents[level], kind='stable')]
+        level_parents = parents[level]
+
+        offsets = np.cumsum(weights[level]) - weights[level]
+        group_starts = np.r_[True, level_parents[1:] != level_parents[:-1]]
+        offsets -= np.maximum.accumulate(np.where(group_starts, offsets, 0))
+
+        ratios = spans[level_parents] / weights[level_parents]
+        starts[level] = starts[level_parents] + offsets * ratios
+        spans[level] = weights[level] * ratios
+
+        angles = starts[level] + spans[level] / 2
+        positions[level, 0] = radius * np.cos(angles)
+        positions[level, 1] = radius * np.sin(angles)
+
+    positions[root] = 0
+
+    return radius + NODE_DISTANCE
+
+
+def radial_layout(graph):
+    positions = np.zeros((len(graph.note_ids), 2))
+    labels = graph.component_labels
+
+    offset_x = 0.0
+    for label in np.unique(labels):
+        nodes = np.flatnonzero(labels == label)
+        radius = _radial_component(graph, nodes, positions)
+        positions[nodes, 0] += offset_x + radius
+        offset_x += 2 * radius
+
+    return positions
+
+
+def force_layout(graph, positions, movable=None, iterations=FULL_ITERATIONS):
+    positions = positions.copy()
+    if not len(positions):
+        return positions
+
+    sources = np.repeat(np.arange(len(positions)), graph.degrees)
+    targets = graph.indices
+    temperature = NODE_DISTANCE * (1 if movable is None else 0.3)
+
+    for _ in range(iterations):
+        minimum = positions.min(axis=0)
+        cell_size = np.maximum((positions.max(axis=0) - minimum) / GRID_SIZE, NODE_DISTANCE)
+        cells = np.minimum(((positions - minimum) // cell_size).astype(np.int64), GRID_SIZE - 1)
+        cell_ids = cells[:, 0] * GRID_SIZE + cells[:, 1]
+
+        masses = np.bincount(cell_ids, minlength=GRID_SIZE * GRID_SIZE)
+        occupied = np.flatnonzero(masses)
+        centers = np.stack([
+            np.bincount(cell_ids, weights=positions[:, axis], minlength=GRID_SIZE * GRID_SIZE)[occupied]
+            for axis in range(2)
+        ], axis=1) / masses[occupied, None]
+
+        squared_distances = (
+            (positions ** 2).sum(axis=1)[:, None] + (centers ** 2).sum(axis=1)[None, :] - 2 * positions @ centers.T
+        )
+        repulsion = masses[occupied] / np.maximum(squared_distances, (NODE_DISTANCE / 2) ** 2)
+        displacements = NODE_DISTANCE ** 2 * (positions * repulsion.sum(axis=1)[:, None] - repulsion @ centers)
+
+        deltas = positions[targets] - positions[sources]
+        distances = np.maximum(np.sqrt((deltas ** 2).sum(axis=1)), 1e-6)
+        attraction = distances / NODE_DISTANCE
+        for axis in range(2):
+            displacements[:, axis] += np.bincount(
+                sources, weights=deltas[:, axis] * attraction, minlength=len(positions),
+            )
+
+        lengths = np.maximum(np.sqrt((displacements ** 2).sum(axis=1)), 1e-6)
+        steps = displacements * (np.minimum(lengths, temperature) / lengths)[:, None]
+        if movable is not None:
+            steps[~movable] = 0
+        positions += steps
+
+        temperature *= 0.92
+
+    return positions
+
+
+def compute_layout(graph):
+    return force_layout(graph, radial_layout(graph))
+
+
+def incremental_layout(graph, positions):
+    missing = np.isnan(positions).any(axis=1)
+    if missing.all():
+        return compute_layout(graph)
+
+    positions = positions.copy()
+    new_notes = missing.copy()
+    sources = np.repeat(np.arange(len(positions)), graph.degrees)
+    targets = graph.indices
+
+    while True:
+        placed_edges = missing[sources] & ~missing[targets]
+        if not placed_edges.any():
+            break
+
+        counts = np.bincount(sources[placed_edges], minlength=len(positions))
+        placing = counts > 0
+        for axis in range(2):
+            sums = np.bincount(sources[placed_edges], weights=positions[targets[placed_edges], axis],
+                               minlength=len(positions))
+            positions[placing, axis] = sums[placing] / counts[placing]
+        positions[placing] += np.random.default_rng(0).uniform(-1, 1, (placing.sum(), 2)) * NODE_DISTANCE / 2
+        missing &= ~placing
+
+    if missing.any():
+        offset_x = np.nanmax(positions[:, 0]) + NODE_DISTANCE
+        positions[missing] = radial_layout(graph)[missing] + [offset_x, 0]
+
+    return force_layout(graph, positions, movable=new_notes, iterations=INCREMENTAL_ITERATIONS)
+
+
+@transaction.atomic()
+def layout_article(article, graph, incremental=True):
+    rows = list(Note.objects.filter(article=article).order_by('id').values_list('id', 'position_x', 'position_y'))
+    note_ids = np.array([note_id for note_id, _, _ in rows], dtype=np.int64)
+    stored_positions = np.array([position for _, *position in rows], dtype=float).reshape(-1, 2)
+
+    # the graph may be read before or after these notes, so align the positions by note id
+    current_positions = np.full((len(graph.note_ids), 2), np.nan)
+    _, graph_indexes, stored_indexes = np.intersect1d(graph.note_ids, note_ids, return_indices=True)
+    current_positions[graph_indexes] = stored_positions[stored_indexes]
+
+    if incremental:
+        positions = incremental_layout(graph, current_positions)
+    else:
+        positions = compute_layout(graph)
+    positions = np.round(positions, 1)
+
+    changed = (positions != current_positions).any(axis=1)
+    now = timezone.now()
+    Note.objects.bulk_update([
+        Note(id=note_id, position_x=position_x, position_y=position_y, updated_at=now)
+        for note_id, (position_x, position_y) in zip(
+            graph.note_ids[changed].tolist(), positions[changed].tolist(),
+        )
+    ], ('position_x', 'position_y', 'updated_at'), batch_size=1000)
+    if changed.any():
+        ArticleCache.instance().invalidate(article.id)
+
+    return [
+        {'id': note_id, 'position_x': position_x, 'position_y': position_y}
+        for note_id, (position_x, position_y) in zip(graph.note_ids.tolist(), positions.tolist())
+    ]
@@ -0,0 +1,78 @@
+import itertools
+import random
+import statistics
+import time
+
+from django.db.models import Q
+from model_bakery import baker
+
+from articles.changes import delete_articles
+from articles.models import Article, Note
+from articles.search import ArticleSearch
+from commons.management.base import BenchmarkCommand
+
+
+class Command(BenchmarkCommand):
+    help = 'Compare indexed article search with a LIKE scan on a generated dataset'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--notes', type=int, default=1000000)
+        parser.add_argument('--articles', type=int, default=100)
+        parser.add_argument('--vocabulary', type=int, default=50000)
+        parser.add_argument('--queries', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        generator = random.Random(options['seed'])
+        vocabulary = [f'w{index}z' for index in range(options['vocabulary'])]
+        cumulative_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+
+        user = baker.make('users.User')
+        try:
+            started_at = time.perf_counter()
+            articles = baker.make('articles.Article', user=user, _quantity=options['articles'])
+            for offset in range(0, options['notes'], 10000):
+                Note.objects.bulk_create([
+                    Note(
+                        article=generator.choice(articles),
+                        contents=' '.join(generator.choices(vocabulary, cum_weights=cumulative_weights, k=12)),
+                    )
+                    for _ in range(min(10000, options['notes'] - offset))
+                ])
+            self.stdout.write(f'generated {options["notes"]} notes in {time.perf_counter() - started_at:.1f}s')
+
+            queries = [
+                ' '.join(generator.sample(vocabulary[10:1000], k=generator.choice((1, 2))))
+                for _ in range(options['queries'])
+            ]
+            search = ArticleSearch.instance()
+
+            started_at = time.perf_counter()
+            search.search(user, queries[0], offset=0, limit=20)
+            self.stdout.write(f'{type(search).__name__} first query {time.perf_counter() - started_at:.2f}s')
+
+            self.stdout.write(f'{"method":<34}{"p50 (ms)":>12}{"p99 (ms)":>12}')
+            self._write_result('indexed search', queries, lambda query: search.search(user, query, offset=0, limit=20))
+            self._write_result('LIKE scan', queries, lambda query: list(self._scan(user, query)[:20]))
+        finally:
+            delete_articles(Article.objects.filter(user=user).values_list('id', flat=True))
+            user.delete()
+
+    @staticmethod
+    def _scan(user, query):
+        condition = Q()
+        for term in query.split():
+            condition &= Q(contents__icontains=term)
+
+        return Note.objects.filter(condition, article__user=user).values_list('id', flat=True)
+
+    def _write_result(self, name, queries, run):
+        latencies = []
+        for query in queries:
+            started_at = time.perf_counter()
+            run(query)
+            latencies.append(time.perf_counter() - started_at)
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(f'{name:<34}{quantiles[49] * 1000:>12.2f}{quantiles[98] * 1000:>12.2f}')
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from articles.models import Article
+from mindnote.urls import router
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Print the EXPLAIN output of every router viewset queryset, action by action'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help='user id used as request.user (default: first user)')
+        parser.add_argument('--article', type=int, help='article id used for detail and filtered actions')
+        parser.add_argument('--analyze', action='store_true', help='run EXPLAIN ANALYZE (postgresql only)')
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(id=options['user']).first() if options['user'] else User.objects.first()
+        if user is None:
+            raise CommandError('There is no user to explain querysets with')
+
+        article_id = options['article']
+        if article_id is None:
+            article_id = Article.objects.filter(user=user).values_list('id', flat=True).first()
+
+        lookup_values = {
+            'users': user.id,
+            'articles': article_id,
+            'notes': None,
+            'connections': None,
+        }
+
+        for prefix, viewset, _basename in router.registry:
+            for route in router.get_routes(viewset):
+                for method, action in route.mapping.items():
+                    if not hasattr(viewset, action) or (not route.detail and method != 'get'):
+                        continue
+
+                    queryset = self._get_queryset(viewset, action, method, route.detail, user, article_id,
+                                                  lookup_values.get(prefix))
+                    explain_options = {'analyze': True} if options['analyze'] else {}
+
+                    self.stdout.write(self.style.MIGRATE_HEADING(f'{prefix} {action} ({method.upper()})'))
+                    self.stdout.write(queryset.explain(**explain_options))
+                    self.stdout.write('')
+
+    @staticmethod
+    def _get_queryset(viewset, action, method, detail, user, article_id, lookup_value):
+        django_request = getattr(APIRequestFactory(), method)('/', {'article': article_id} if method == 'get' else {})
+        force_authenticate(django_request, user=user)
+
+        view = viewset(action_map={method: action}, args=(), kwargs={}, format_kwarg=None)
+        view.request = view.initialize_request(django_request)
+
+        queryset = view.filter_queryset(view.get_queryset()) if method == 'get' else view.get_queryset()
+
+        if detail:
+            lookup_field = view.lookup_field
+            if lookup_value is None:
+                lookup_value = queryset.values_list(lookup_field, flat=True).first()
+            queryset = queryset.filter(**{lookup_field: lookup_value})
+
+        return queryset
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from articles.changes import purge_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Delete tombstones of deleted notes and connections older than the article changes retention'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        purged_count = purge_tombstones(options['batch_size'])
+
+        self.stdout.write(f'purged {purged_count} tombstones')
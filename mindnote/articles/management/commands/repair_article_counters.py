@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from articles.counters import repair_article_counters
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    help = 'Recompute note_count, connection_count and last_activity_at of articles whose counters drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help='only repair articles of this user')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = Article.objects.order_by('id')
+        if options['user']:
+            queryset = queryset.filter(user=options['user'])
+
+        repaired_count = 0
+        last_id = 0
+        while True:
+            batch_ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:options['batch_size']])
+            if not batch_ids:
+                break
+
+            repaired_count += repair_article_counters(Article.objects.filter(id__in=batch_ids))
+            last_id = batch_ids[-1]
+
+        self.stdout.write(f'repaired {repaired_count} articles')
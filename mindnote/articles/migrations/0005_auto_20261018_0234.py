@@ -0,0 +1,39 @@
+# Generated by Django 3.1.5 on 2026-10-17 17:34
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def delete_duplicated_connections(apps, schema_editor):
+    Connection = apps.get_model('articles', 'Connection')
+
+    kept_connection_ids = Connection.objects.order_by().values('left_note', 'right_note') \
+        .annotate(kept_id=Min('id')).values('kept_id')
+    Connection.objects.exclude(id__in=kept_connection_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_auto_20210303_1425'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['user', 'created_at'], name='articles_ar_user_id_8ba355_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='connection',
+            index=models.Index(fields=['article', 'created_at'], name='articles_co_article_282b6a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['article', 'created_at'], name='articles_no_article_785a48_idx'),
+        ),
+        migrations.RunPython(delete_duplicated_connections, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='connection',
+            constraint=models.UniqueConstraint(fields=('left_note', 'right_note'), name='unique_connection_notes'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.1.5 on 2026-10-17 17:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_auto_20261018_0234'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+                ('model_name', models.CharField(choices=[('note', 'Note'), ('connection', 'Connection')], max_length=32)),
+                ('object_id', models.PositiveIntegerField()),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='connection',
+            index=models.Index(fields=['article', 'updated_at'], name='articles_co_article_a6d50b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['article', 'updated_at'], name='articles_no_article_4142c9_idx'),
+        ),
+        migrations.AddField(
+            model_name='tombstone',
+            name='article',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to='articles.article'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['article', 'created_at'], name='articles_to_article_067dc6_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.1.5 on 2026-10-17 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_auto_20261018_0246'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='position_x',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='position_y',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
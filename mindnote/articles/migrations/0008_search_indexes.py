@@ -0,0 +1,44 @@
+from django.db import migrations
+
+SEARCH_INDEXES = (
+    (
+        'articles_article_search_idx',
+        'articles_article',
+        """COALESCE("subject", '') || ' ' || COALESCE("description", '') || ' ' || COALESCE("body", '')""",
+    ),
+    (
+        'articles_note_search_idx',
+        'articles_note',
+        """COALESCE("contents", '')""",
+    ),
+)
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, table, document in SEARCH_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" '
+            f'USING gin (to_tsvector(\'simple\'::regconfig, {document}))'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, _table, _document in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_auto_20261018_0253'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
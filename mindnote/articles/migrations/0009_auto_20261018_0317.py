@@ -0,0 +1,53 @@
+# Generated by Django 3.1.5 on 2026-10-17 18:17
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+
+def backfill_article_counters(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    Note = apps.get_model('articles', 'Note')
+    Connection = apps.get_model('articles', 'Connection')
+
+    def aggregate_subquery(model, aggregate):
+        return Subquery(
+            model.objects.filter(article=OuterRef('pk')).order_by().values('article')
+            .annotate(value=aggregate).values('value')
+        )
+
+    Article.objects.update(
+        note_count=Coalesce(aggregate_subquery(Note, Count('id')), 0),
+        connection_count=Coalesce(aggregate_subquery(Connection, Count('id')), 0),
+        last_activity_at=Greatest(
+            'updated_at',
+            Coalesce(aggregate_subquery(Note, Max('updated_at')), 'updated_at'),
+            Coalesce(aggregate_subquery(Connection, Max('updated_at')), 'updated_at'),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='connection_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='note_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_article_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+UNDIRECTED_INDEX_NAME = 'unique_connection_undirected_notes'
+# the same pair in either order, with the functions each vendor offers for it
+UNDIRECTED_INDEX_EXPRESSIONS = {
+    'postgresql': 'LEAST("left_note_id", "right_note_id"), GREATEST("left_note_id", "right_note_id")',
+    'sqlite': 'MIN("left_note_id", "right_note_id"), MAX("left_note_id", "right_note_id")',
+}
+
+
+def delete_reversed_connections(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    Connection = apps.get_model('articles', 'Connection')
+
+    reversed_connections = Connection.objects.filter(Exists(Connection.objects.filter(
+        left_note=OuterRef('right_note'), right_note=OuterRef('left_note'), id__lt=OuterRef('id'),
+    )))
+    article_ids = set(reversed_connections.values_list('article_id', flat=True))
+    if not article_ids:
+        return
+
+    reversed_connections.delete()
+    Article.objects.filter(id__in=article_ids).update(connection_count=Coalesce(Subquery(
+        Connection.objects.filter(article=OuterRef('pk')).order_by().values('article')
+        .annotate(value=Count('id')).values('value')
+    ), 0))
+
+
+def create_undirected_index(apps, schema_editor):
+    expressions = UNDIRECTED_INDEX_EXPRESSIONS.get(schema_editor.connection.vendor)
+    if expressions is None:
+        return
+
+    schema_editor.execute(
+        f'CREATE UNIQUE INDEX IF NOT EXISTS "{UNDIRECTED_INDEX_NAME}" ON "articles_connection" ({expressions})'
+    )
+
+
+def drop_undirected_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in UNDIRECTED_INDEX_EXPRESSIONS:
+        return
+
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{UNDIRECTED_INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_auto_20261018_0317'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_reversed_connections, migrations.RunPython.noop),
+        migrations.RunPython(create_undirected_index, drop_undirected_index),
+    ]
@@ -0,0 +1,51 @@
+from django.db import transaction
+
+from articles.caches import ArticleCache
+from articles.counters import record_article_activity
+
+
+class InvalidateArticleCacheMixin:
+    article_id_field = 'article_id'
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.invalidate_article_cache(getattr(serializer.instance, self.article_id_field))
+
+    def perform_update(self, serializer):
+        previous_article_id = getattr(serializer.instance, self.article_id_field)
+        super().perform_update(serializer)
+        article_id = getattr(serializer.instance, self.article_id_field)
+        self.invalidate_article_cache(article_id)
+        if article_id != previous_article_id:
+            self.invalidate_article_cache(previous_article_id)
+
+    def perform_destroy(self, instance):
+        article_id = getattr(instance, self.article_id_field)
+        super().perform_destroy(instance)
+        self.invalidate_article_cache(article_id)
+
+    def invalidate_article_cache(self, article_id):
+        ArticleCache.instance().invalidate(article_id)
+
+
+class RecordArticleActivityMixin:
+    article_id_field = 'article_id'
+    article_counter_field = None
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            super().perform_create(serializer)
+            counters = {self.article_counter_field: 1} if self.article_counter_field else {}
+            record_article_activity(getattr(serializer.instance, self.article_id_field), **counters)
+
+    def perform_update(self, serializer):
+        previous_article_id = getattr(serializer.instance, self.article_id_field)
+        with transaction.atomic():
+            super().perform_update(serializer)
+            article_id = getattr(serializer.instance, self.article_id_field)
+            if article_id == previous_article_id or not self.article_counter_field:
+                record_article_activity(article_id)
+                return
+
+            record_article_activity(previous_article_id, **{self.article_counter_field: -1})
+            record_article_activity(article_id, **{self.article_counter_field: 1})
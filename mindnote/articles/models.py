@@ -7,6 +7,14 @@ class Article(BaseModel):
     subject = models.CharField(max_length=512)
     description = models.CharField(max_length=512, blank=True)
     body = models.TextField(blank=True)
+    note_count = models.IntegerField(default=0)
+    connection_count = models.IntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['user', 'created_at']),
+        ]
 
     @property
     def is_published(self):
@@ -16,6 +24,14 @@ class Article(BaseModel):
 class Note(BaseModel):
     article = models.ForeignKey('articles.Article', related_name='notes', on_delete=models.CASCADE)
     contents = models.TextField(blank=True)
+    position_x = models.FloatField(null=True, blank=True)
+    position_y = models.FloatField(null=True, blank=True)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['article', 'created_at']),
+            models.Index(fields=['article', 'updated_at']),
+        ]
 
 
 class Connection(BaseModel):
@@ -23,3 +39,27 @@ class Connection(BaseModel):
     left_note = models.ForeignKey('articles.Note', related_name='connections_as_left_side', on_delete=models.CASCADE)
     right_note = models.ForeignKey('articles.Note', related_name='connections_as_right_side', on_delete=models.CASCADE)
     reason = models.TextField(blank=True)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['article', 'created_at']),
+            models.Index(fields=['article', 'updated_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['left_note', 'right_note'], name='unique_connection_notes'),
+        ]
+
+
+class Tombstone(BaseModel):
+    class ModelName(models.TextChoices):
+        NOTE = 'note'
+        CONNECTION = 'connection'
+
+    article = models.ForeignKey('articles.Article', related_name='tombstones', on_delete=models.CASCADE)
+    model_name = models.CharField(max_length=32, choices=ModelName.choices)
+    object_id = models.PositiveIntegerField()
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['article', 'created_at']),
+        ]
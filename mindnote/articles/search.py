@@ -0,0 +1,153 @@
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import defaultdict, Counter
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.db.models import Value, CharField, F, Max, Count
+from django.dispatch import receiver
+
+from articles.models import Article, Note
+from commons.caches import LRUCache
+
+SEARCH_CONFIG = 'simple'
+ARTICLE_SEARCH_FIELDS = ('subject', 'description', 'body')
+NOTE_SEARCH_FIELDS = ('contents',)
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class ArticleSearch(ABC):
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if ArticleSearch._instance is None:
+            if connection.vendor == 'postgresql':
+                ArticleSearch._instance = ArticleSearchWithPostgres()
+            else:
+                ArticleSearch._instance = ArticleSearchWithInvertedIndex()
+
+        return ArticleSearch._instance
+
+    @classmethod
+    def reset(cls):
+        ArticleSearch._instance = None
+
+    @abstractmethod
+    def search(self, user, query, offset, limit):
+        pass
+
+
+class ArticleSearchWithPostgres(ArticleSearch):
+    def search(self, user, query, offset, limit):
+        rows = self.get_queryset(user, query).order_by('-rank', 'kind', 'id')[offset:offset + limit]
+
+        return [
+            {'kind': row['kind'], 'id': row['id'], 'article': row['article_pk'], 'rank': row['rank']}
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_queryset(user, query):
+        from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
+
+        search_query = SearchQuery(query, config=SEARCH_CONFIG)
+
+        def ranked(queryset, kind, fields, article_field):
+            vector = SearchVector(*fields, config=SEARCH_CONFIG)
+
+            return queryset.annotate(vector=vector).filter(vector=search_query).annotate(
+                kind=Value(kind, output_field=CharField()),
+                article_pk=F(article_field),
+                rank=SearchRank(vector, search_query),
+            ).order_by().values('kind', 'id', 'article_pk', 'rank')
+
+        articles = ranked(Article.objects.filter(user=user), 'article', ARTICLE_SEARCH_FIELDS, 'id')
+        notes = ranked(Note.objects.filter(article__user=user), 'note', NOTE_SEARCH_FIELDS, 'article_id')
+
+        return articles.union(notes, all=True)
+
+
+class InvertedIndex:
+    def __init__(self, documents):
+        self.postings = defaultdict(dict)
+        self.size = 0
+
+        for key, text in documents:
+            self.size += 1
+            for term, frequency in Counter(tokenize(text)).items():
+                self.postings[term][key] = frequency
+
+    def search(self, query):
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        postings = sorted((self.postings.get(term, {}) for term in terms), key=len)
+        keys = set(postings[0]).intersection(*postings[1:])
+
+        scores = {
+            key: sum(
+                (1 + math.log(term_postings[key])) * math.log(1 + self.size / len(term_postings))
+                for term_postings in postings
+            )
+            for key in keys
+        }
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+class ArticleSearchWithInvertedIndex(ArticleSearch):
+    def __init__(self):
+        options = settings.ARTICLE_SEARCH_INDEX_CACHE
+        self._indexes = LRUCache(max_size=options['MAX_SIZE'], timeout=options['TIMEOUT'])
+
+    def search(self, user, query, offset, limit):
+        index = self.get_index(user)
+
+        return [
+            {'kind': kind, 'id': object_id, 'article': article_id, 'rank': rank}
+            for (kind, object_id, article_id), rank in index.search(query)[offset:offset + limit]
+        ]
+
+    def get_index(self, user):
+        version = self._get_version(user)
+
+        cached = self._indexes.get(user.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        index = InvertedIndex(self._get_documents(user))
+        self._indexes.set(user.id, (version, index))
+
+        return index
+
+    @staticmethod
+    def _get_version(user):
+        articles = Article.objects.filter(user=user).aggregate(updated_at=Max('updated_at'), count=Count('id'))
+        notes = Note.objects.filter(article__user=user).aggregate(updated_at=Max('updated_at'), count=Count('id'))
+
+        return articles['updated_at'], articles['count'], notes['updated_at'], notes['count']
+
+    @staticmethod
+    def _get_documents(user):
+        for article_id, *texts in Article.objects.filter(user=user).values_list('id', *ARTICLE_SEARCH_FIELDS):
+            yield ('article', article_id, article_id), ' '.join(texts)
+
+        for note_id, article_id, contents in Note.objects.filter(article__user=user).values_list(
+            'id', 'article_id', *NOTE_SEARCH_FIELDS,
+        ):
+            yield ('note', note_id, article_id), contents
+
+
+@receiver(setting_changed)
+def reset_article_search(setting, **kwargs):
+    if setting == 'ARTICLE_SEARCH_INDEX_CACHE':
+        ArticleSearch.reset()
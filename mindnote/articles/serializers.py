@@ -1,10 +1,15 @@
+from django.db import transaction, IntegrityError
+from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
+from articles.changes import delete_graph_objects, get_changes_retained_since
+from articles.counters import record_article_activity
 from articles.models import Article, Note, Connection
+from commons.serializers import SparseFieldsetSerializerMixin
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Article
         fields = (
@@ -13,25 +18,41 @@ class ArticleSerializer(serializers.ModelSerializer):
             'subject',
             'body',
             'description',
+            'note_count',
+            'connection_count',
+            'last_activity_at',
             'created_at',
             'updated_at',
         )
+        read_only_fields = ('note_count', 'connection_count', 'last_activity_at')
 
+    def create(self, validated_data):
+        validated_data['last_activity_at'] = timezone.now()
 
-class NoteSerializer(serializers.ModelSerializer):
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        validated_data['last_activity_at'] = timezone.now()
+
+        return super().update(instance, validated_data)
+
+
+class NoteSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Note
         fields = (
             'id',
             'article',
             'contents',
+            'position_x',
+            'position_y',
             'created_at',
             'updated_at',
         )
 
     def validate(self, attrs):
         if 'article' in attrs:
-            if attrs['article'].user != self.context['request'].user:
+            if attrs['article'].user_id != self.context['request'].user.id:
                 raise PermissionDenied(detail='note can be created at own article')
 
         return attrs
@@ -52,18 +73,35 @@ class ConnectionSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         if 'article' in attrs:
-            if attrs['article'].user != self.context['request'].user:
+            if attrs['article'].user_id != self.context['request'].user.id:
                 raise PermissionDenied(detail='connection can be created at own article')
 
-        if 'left_note' in attrs and 'right_note' in attrs:
-            if attrs['left_note'] == attrs['right_note']:
+        if 'article' in attrs or 'left_note' in attrs or 'right_note' in attrs:
+            left_note_id, left_note_article_id = self._get_note_ids(attrs, 'left_note')
+            right_note_id, right_note_article_id = self._get_note_ids(attrs, 'right_note')
+            if left_note_id == right_note_id:
                 raise ValidationError(detail="notes can't be same")
 
-            if attrs['left_note'].article != attrs['article'] or attrs['right_note'].article != attrs['article']:
+            article_id = attrs['article'].id if 'article' in attrs else self.instance.article_id
+            if left_note_article_id != article_id or right_note_article_id != article_id:
                 raise ValidationError(detail='notes and article are not matched')
 
         return attrs
 
+    def _get_note_ids(self, attrs, field_name):
+        if field_name in attrs:
+            return attrs[field_name].id, attrs[field_name].article_id
+
+        # a partial update keeps the stored note, which belongs to the stored article
+        return getattr(self.instance, f'{field_name}_id'), self.instance.article_id
+
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError:
+            raise ValidationError(detail='connection already exists')
+
 
 class RetrieveArticleSerializer(serializers.ModelSerializer):
     notes = NoteSerializer(many=True)
@@ -82,3 +120,170 @@ class RetrieveArticleSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         )
+
+
+class NoteBatchCreateSerializer(serializers.Serializer):
+    contents = serializers.CharField(allow_blank=True, required=False, default='')
+
+
+class NoteBatchUpdateSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    contents = serializers.CharField(allow_blank=True)
+
+
+class NoteBatchSerializer(serializers.Serializer):
+    create = NoteBatchCreateSerializer(many=True, required=False)
+    update = NoteBatchUpdateSerializer(many=True, required=False)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+
+class ConnectionBatchCreateSerializer(serializers.Serializer):
+    left_note = serializers.IntegerField()
+    right_note = serializers.IntegerField()
+    reason = serializers.CharField(allow_blank=True, required=False, default='')
+
+
+class ConnectionBatchUpdateSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    reason = serializers.CharField(allow_blank=True)
+
+
+class ConnectionBatchSerializer(serializers.Serializer):
+    create = ConnectionBatchCreateSerializer(many=True, required=False)
+    update = ConnectionBatchUpdateSerializer(many=True, required=False)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+
+class BatchSerializer(serializers.Serializer):
+    notes = NoteBatchSerializer(required=False, default=dict)
+    connections = ConnectionBatchSerializer(required=False, default=dict)
+
+    def validate(self, attrs):
+        article = self.context['article']
+        notes = attrs['notes']
+        connections = attrs['connections']
+
+        for connection in connections.get('create', []):
+            if connection['left_note'] == connection['right_note']:
+                raise ValidationError(detail="notes can't be same")
+
+        note_ids = {note['id'] for note in notes.get('update', [])}
+        note_ids.update(notes.get('delete', []))
+        for connection in connections.get('create', []):
+            note_ids.update((connection['left_note'], connection['right_note']))
+
+        connection_ids = {connection['id'] for connection in connections.get('update', [])}
+        connection_ids.update(connections.get('delete', []))
+
+        attrs['notes_by_id'] = Note.objects.filter(article=article, id__in=note_ids).in_bulk() if note_ids else {}
+        if len(attrs['notes_by_id']) != len(note_ids):
+            raise ValidationError(detail='notes and article are not matched')
+
+        attrs['connections_by_id'] = Connection.objects.filter(
+            article=article, id__in=connection_ids,
+        ).in_bulk() if connection_ids else {}
+        if len(attrs['connections_by_id']) != len(connection_ids):
+            raise ValidationError(detail='connections and article are not matched')
+
+        return attrs
+
+    def save(self, **kwargs):
+        try:
+            return super().save(**kwargs)
+        except IntegrityError:
+            raise ValidationError(detail='connection already exists')
+
+    @transaction.atomic()
+    def create(self, validated_data):
+        article = self.context['article']
+        notes = validated_data['notes']
+        connections = validated_data['connections']
+        notes_by_id = validated_data['notes_by_id']
+        connections_by_id = validated_data['connections_by_id']
+        now = timezone.now()
+
+        created_notes = Note.objects.bulk_create([
+            Note(article=article, contents=note['contents']) for note in notes.get('create', [])
+        ])
+
+        updated_notes = []
+        for note_data in notes.get('update', []):
+            note = notes_by_id[note_data['id']]
+            note.contents = note_data['contents']
+            note.updated_at = now
+            updated_notes.append(note)
+        Note.objects.bulk_update(updated_notes, ('contents', 'updated_at'))
+
+        created_connections = Connection.objects.bulk_create([
+            Connection(
+                article=article,
+                left_note_id=connection['left_note'],
+                right_note_id=connection['right_note'],
+                reason=connection['reason'],
+            )
+            for connection in connections.get('create', [])
+        ])
+
+        updated_connections = []
+        for connection_data in connections.get('update', []):
+            connection = connections_by_id[connection_data['id']]
+            connection.reason = connection_data['reason']
+            connection.updated_at = now
+            updated_connections.append(connection)
+        Connection.objects.bulk_update(updated_connections, ('reason', 'updated_at'))
+
+        if created_notes or updated_notes or created_connections or updated_connections:
+            record_article_activity(article.id, note_count=len(created_notes),
+                                    connection_count=len(created_connections))
+        if notes.get('delete') or connections.get('delete'):
+            delete_graph_objects(article.id, note_ids=notes.get('delete', []),
+                                 connection_ids=connections.get('delete', []))
+
+        return {
+            'created_notes': created_notes,
+            'created_connections': created_connections,
+        }
+
+    def to_representation(self, instance):
+        return {
+            'created_notes': NoteSerializer(instance['created_notes'], many=True).data,
+            'created_connections': ConnectionSerializer(instance['created_connections'], many=True).data,
+        }
+
+
+class ChangesQuerySerializer(serializers.Serializer):
+    since = serializers.DateTimeField()
+
+    def validate_since(self, since):
+        if since < get_changes_retained_since():
+            raise ValidationError(detail='since is older than the retained changes, retrieve the whole article',
+                                  code='expired')
+
+        return since
+
+
+class ChangesSerializer(serializers.Serializer):
+    notes = NoteSerializer(many=True)
+    connections = ConnectionSerializer(many=True)
+    deleted_notes = serializers.ListField(child=serializers.IntegerField())
+    deleted_connections = serializers.ListField(child=serializers.IntegerField())
+    until = serializers.DateTimeField()
+
+
+class GraphDegreesQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+
+class GraphShortestPathQuerySerializer(serializers.Serializer):
+    source = serializers.IntegerField()
+    target = serializers.IntegerField()
+
+
+class LayoutSerializer(serializers.Serializer):
+    mode = serializers.ChoiceField(choices=('full', 'incremental'), default='incremental')
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField()
+    page = serializers.IntegerField(min_value=1, default=1)
+    page_size = serializers.IntegerField(min_value=1, max_value=100, default=20)
@@ -0,0 +1,78 @@
+import json
+import tempfile
+
+from assertpy import assert_that
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.caches import ArticleCache
+from articles.tests.fixtures import make_article
+
+
+class ArticleCacheTestCase(APITestCase):
+    def setUp(self):
+        ArticleCache.reset()
+        self.user, self.article, self.notes, _ = make_article(3)
+
+        self.client.force_authenticate(user=self.user)
+
+    def _assert_retrieve_is_cached(self):
+        with self.assertNumQueries(4):
+            first_response = self.client.get(f'/articles/{self.article.id}/')
+        with self.assertNumQueries(2):
+            second_response = self.client.get(f'/articles/{self.article.id}/')
+
+        assert_that(second_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(second_response.data).is_equal_to(first_response.data)
+        assert_that(ArticleCache.instance().metrics()).contains_entry({'hits': 1}, {'misses': 1})
+
+    def test_should_retrieve_from_local_memory_cache(self):
+        self._assert_retrieve_is_cached()
+
+    def test_should_retrieve_from_django_cache(self):
+        with override_settings(ARTICLE_CACHE={
+            'BACKEND': 'django',
+            'CACHE_ALIAS': 'default',
+            'TIMEOUT': 60,
+            'MAX_SIZE': 100,
+        }):
+            self._assert_retrieve_is_cached()
+
+    def test_should_retrieve_from_file_cache(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(ARTICLE_CACHE={
+            'BACKEND': 'file',
+            'LOCATION': location,
+            'TIMEOUT': 60,
+            'MAX_SIZE': 100,
+        }):
+            self._assert_retrieve_is_cached()
+
+    def test_should_invalidate_when_note_is_updated(self):
+        self.client.get(f'/articles/{self.article.id}/')
+        self.client.patch(f'/notes/{self.notes[0].id}/', data=json.dumps({'contents': 'changed contents'}),
+                          content_type='application/json')
+        response = self.client.get(f'/articles/{self.article.id}/')
+
+        assert_that(response.data['notes'][0]['contents']).is_equal_to('changed contents')
+        assert_that(ArticleCache.instance().metrics()).contains_entry({'hits': 0}, {'invalidations': 1})
+
+    def test_should_miss_when_version_is_changed(self):
+        article_cache = ArticleCache.instance()
+        article_cache.set(self.article.id, 'old version', {'id': self.article.id})
+
+        assert_that(article_cache.get(self.article.id, 'new version')).is_none()
+        assert_that(article_cache.get(self.article.id, 'old version')).is_equal_to({'id': self.article.id})
+
+    @override_settings(ARTICLE_CACHE={
+        'BACKEND': 'local',
+        'TIMEOUT': 60,
+        'MAX_SIZE': 1,
+    })
+    def test_should_count_evictions(self):
+        article_cache = ArticleCache.instance()
+        article_cache.set(1, 'version', {'id': 1})
+        article_cache.set(2, 'version', {'id': 2})
+
+        assert_that(article_cache.get(1, 'version')).is_none()
+        assert_that(article_cache.metrics()['evictions']).is_equal_to(1)
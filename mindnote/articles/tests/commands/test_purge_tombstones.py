@@ -0,0 +1,24 @@
+from datetime import timedelta
+from io import StringIO
+
+from assertpy import assert_that
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery import baker
+
+from articles.models import Tombstone
+
+
+class PurgeTombstonesTestCase(TestCase):
+    def test_should_purge_tombstones_older_than_retention(self):
+        expired_tombstones = baker.make('articles.Tombstone', _quantity=3)
+        Tombstone.objects.filter(id__in=[tombstone.id for tombstone in expired_tombstones]) \
+            .update(created_at=timezone.now() - timedelta(days=31))
+        retained_tombstone = baker.make('articles.Tombstone')
+
+        output = StringIO()
+        call_command('purge_tombstones', batch_size=2, stdout=output)
+
+        assert_that(list(Tombstone.objects.values_list('id', flat=True))).is_equal_to([retained_tombstone.id])
+        assert_that(output.getvalue()).contains('purged 3 tombstones')
@@ -0,0 +1,27 @@
+from io import StringIO
+
+from assertpy import assert_that
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery import baker
+
+from articles.models import Article
+
+
+class RepairArticleCountersTestCase(TestCase):
+    def test_should_repair_drifted_counters(self):
+        article = baker.make('articles.Article', note_count=7, connection_count=0)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        untouched_article = baker.make('articles.Article', last_activity_at=article.created_at)
+
+        output = StringIO()
+        call_command('repair_article_counters', batch_size=1, stdout=output)
+
+        article.refresh_from_db()
+        assert_that(article.note_count).is_equal_to(2)
+        assert_that(article.connection_count).is_equal_to(1)
+        assert_that(article.last_activity_at).is_greater_than_or_equal_to(notes[1].updated_at)
+        assert_that(Article.objects.get(id=untouched_article.id).last_activity_at) \
+            .is_equal_to(untouched_article.last_activity_at)
+        assert_that(output.getvalue()).contains('repaired 1 articles')
@@ -0,0 +1,21 @@
+from collections import namedtuple
+
+from model_bakery import baker
+
+ArticleFixture = namedtuple('ArticleFixture', ('user', 'article', 'notes', 'connections'))
+
+
+def make_article(note_size=0, edges=(), **article_fields):
+    user = baker.make('users.User')
+    article = baker.make('articles.Article', user=user, **article_fields)
+    notes = [baker.make('articles.Note', article=article) for _ in range(note_size)]
+    connections = [
+        baker.make('articles.Connection', article=article, left_note=notes[left], right_note=notes[right])
+        for left, right in edges
+    ]
+
+    return ArticleFixture(user=user, article=article, notes=notes, connections=connections)
+
+
+def chain(note_size):
+    return list(zip(range(note_size - 1), range(1, note_size)))
@@ -1,11 +1,16 @@
 import json
+from datetime import timedelta
+from unittest import mock
 
 from assertpy import assert_that
+from django.test import override_settings
+from django.utils import timezone
 from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from articles.models import Article
+from articles.caches import ArticleCache
+from articles.models import Article, Note, Connection, Tombstone
 
 
 class ArticlesViewSetTestCase(APITestCase):
@@ -62,6 +67,64 @@ class ArticlesViewSetTestCase(APITestCase):
         for response_article, expected_article in zip(response.data, articles):
             self._assert_article(response_article, expected_article)
 
+    def test_should_get_own_list_with_cursor_pagination(self):
+        user = baker.make('users.User')
+        article_quantity = 5
+        articles = baker.make('articles.Article', user=user, _quantity=article_quantity)
+
+        self.client.force_authenticate(user=user)
+        first_response = self.client.get('/articles/my-list/?page_size=3')
+
+        assert_that(first_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(first_response.data['results']).is_length(3)
+        assert_that(first_response.data['previous']).is_none()
+
+        second_response = self.client.get(first_response.data['next'])
+
+        assert_that(second_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(second_response.data['results']).is_length(2)
+        assert_that(second_response.data['next']).is_none()
+
+        response_articles = first_response.data['results'] + second_response.data['results']
+        for response_article, expected_article in zip(response_articles, articles):
+            self._assert_article(response_article, expected_article)
+
+    def test_should_get_own_list_with_sparse_fieldset(self):
+        user = baker.make('users.User')
+        articles = baker.make('articles.Article', user=user, _quantity=3)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get('/articles/my-list/?fields=id,subject,createdAt')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        for response_article, expected_article in zip(response.data, articles):
+            assert_that(response_article).is_equal_to({
+                'id': expected_article.id,
+                'subject': expected_article.subject,
+                'created_at': response_article['created_at'],
+            })
+
+    def test_should_get_own_list_with_counters(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user, note_count=2)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+
+        self.client.force_authenticate(user=user)
+        self.client.post('/notes/', data=json.dumps({'article': article.id, 'contents': 'created'}),
+                         content_type='application/json')
+        self.client.post('/connections/', data=json.dumps({
+            'article': article.id,
+            'left_note': notes[0].id,
+            'right_note': notes[1].id,
+        }), content_type='application/json')
+        self.client.delete(f'/notes/{notes[0].id}/')
+        response = self.client.get('/articles/my-list/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data[0]['note_count']).is_equal_to(2)
+        assert_that(response.data[0]['connection_count']).is_equal_to(0)
+        assert_that(response.data[0]['last_activity_at']).is_not_none()
+
     def test_should_not_get_own_list_unauthorized(self):
         baker.make('articles.Article', _quantity=5)
         response = self.client.get('/articles/my-list/')
@@ -110,6 +173,42 @@ class ArticlesViewSetTestCase(APITestCase):
             assert_that(response_connection['right_note']).is_equal_to(expected_connection.right_note.id)
             assert_that(response_connection['reason']).is_equal_to(expected_connection.reason)
 
+    def test_should_retrieve_with_validators(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.has_header('ETag')).is_true()
+        assert_that(response.has_header('Last-Modified')).is_true()
+
+    def test_should_not_modified_when_etag_matched(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        etag = self.client.get(f'/articles/{article.id}/')['ETag']
+        response = self.client.get(f'/articles/{article.id}/', HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_304_NOT_MODIFIED)
+        assert_that(response['ETag']).is_equal_to(etag)
+
+    def test_should_change_etag_when_note_is_changed(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        note = baker.make('articles.Note', article=article)
+
+        self.client.force_authenticate(user=user)
+        etag = self.client.get(f'/articles/{article.id}/')['ETag']
+        self.client.delete(f'/notes/{note.id}/')
+        response = self.client.get(f'/articles/{article.id}/', HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response['ETag']).is_not_equal_to(etag)
+        assert_that(response.data['notes']).is_equal_to([])
+
     def test_should_not_retrieve_unauthorized(self):
         article = baker.make('articles.Article')
 
@@ -127,6 +226,111 @@ class ArticlesViewSetTestCase(APITestCase):
 
         assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
 
+    def test_should_get_graph(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=4)
+        connections = [
+            baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[2]),
+            baker.make('articles.Connection', article=article, left_note=notes[3], right_note=notes[1]),
+        ]
+        _another_article_notes = baker.make('articles.Note', _quantity=3)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/graph/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['id']).is_equal_to(article.id)
+        assert_that(response.data['note_ids']).is_equal_to([note.id for note in notes])
+        assert_that(response.data['note_contents']).is_equal_to([note.contents for note in notes])
+        assert_that(response.data['connection_ids']).is_equal_to([connection.id for connection in connections])
+        assert_that(response.data['connection_pairs']).is_equal_to([(0, 2), (3, 1)])
+        assert_that(response.data['connection_reasons']).is_equal_to([connection.reason for connection in connections])
+
+    def test_should_get_graph_without_connections_to_notes_committed_after_reading_notes(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        connection = baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        filter_connections = Connection.objects.filter
+
+        def commit_note_and_filter_connections(*args, **kwargs):
+            late_note = baker.make('articles.Note', article=article)
+            baker.make('articles.Connection', article=article, left_note=notes[0], right_note=late_note)
+            return filter_connections(*args, **kwargs)
+
+        self.client.force_authenticate(user=user)
+        with mock.patch.object(Connection.objects, 'filter', side_effect=commit_note_and_filter_connections):
+            response = self.client.get(f'/articles/{article.id}/graph/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['note_ids']).is_equal_to([note.id for note in notes])
+        assert_that(response.data['connection_ids']).is_equal_to([connection.id])
+
+    def test_should_not_get_graph_forbidden(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article')
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/graph/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
+
+    def test_should_get_changes(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        unchanged_note, changed_note, deleted_note = baker.make('articles.Note', article=article, _quantity=3)
+        deleted_connection = baker.make('articles.Connection', article=article,
+                                        left_note=unchanged_note, right_note=deleted_note)
+        since = timezone.now()
+
+        self.client.force_authenticate(user=user)
+        self.client.patch(f'/notes/{changed_note.id}/', data=json.dumps({'contents': 'changed contents'}),
+                          content_type='application/json')
+        self.client.delete(f'/notes/{deleted_note.id}/')
+        response = self.client.get(f'/articles/{article.id}/changes/', {'since': since.isoformat()})
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that([note['id'] for note in response.data['notes']]).is_equal_to([changed_note.id])
+        assert_that(response.data['connections']).is_equal_to([])
+        assert_that(response.data['deleted_notes']).is_equal_to([deleted_note.id])
+        assert_that(response.data['deleted_connections']).is_equal_to([deleted_connection.id])
+
+        response = self.client.get(f'/articles/{article.id}/changes/', {'since': response.data['until']})
+
+        assert_that(response.data['notes']).is_equal_to([])
+        assert_that(response.data['deleted_notes']).is_equal_to([])
+
+    def test_should_not_get_changes_without_since(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/changes/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(ARTICLE_CHANGES={'RETENTION': 60})
+    def test_should_not_get_changes_older_than_retention(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/changes/',
+                                   {'since': (timezone.now() - timedelta(seconds=120)).isoformat()})
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(response.data['since'][0].code).is_equal_to('expired')
+
+    def test_should_not_get_changes_forbidden(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article')
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/changes/', {'since': timezone.now().isoformat()})
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
+
     def test_should_update(self):
         user = baker.make('users.User')
         article = baker.make('articles.Article', user=user)
@@ -185,6 +389,26 @@ class ArticlesViewSetTestCase(APITestCase):
         assert_that(response.status_code).is_equal_to(status.HTTP_204_NO_CONTENT)
         assert_that(Article.objects.filter(id=article.id).exists()).is_false()
 
+    def test_should_delete_with_graph(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=3)
+        baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        baker.make('articles.Tombstone', article=article)
+        another_note = baker.make('articles.Note')
+
+        self.client.force_authenticate(user=user)
+        self.client.get(f'/articles/{article.id}/')
+        response = self.client.delete(f'/articles/{article.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_204_NO_CONTENT)
+        assert_that(Article.objects.filter(id=article.id).exists()).is_false()
+        assert_that(Note.objects.filter(article_id=article.id).exists()).is_false()
+        assert_that(Connection.objects.filter(article_id=article.id).exists()).is_false()
+        assert_that(Tombstone.objects.filter(article_id=article.id).exists()).is_false()
+        assert_that(ArticleCache.instance().get_entry(article.id)).is_none()
+        assert_that(Note.objects.filter(id=another_note.id).exists()).is_true()
+
     def test_should_not_delete_unauthorized(self):
         article = baker.make('articles.Article')
 
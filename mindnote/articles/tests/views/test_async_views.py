@@ -0,0 +1,43 @@
+import asyncio
+
+from assertpy import assert_that
+from django.test import TransactionTestCase, AsyncClient, override_settings
+from rest_framework import status
+
+from articles.tests.fixtures import make_article
+
+
+@override_settings(ROOT_URLCONF='mindnote.asgi_urls')
+class AsyncViewsTestCase(TransactionTestCase):
+    def setUp(self):
+        self.user, self.article, self.notes, _ = make_article(3)
+        self.client = AsyncClient()
+        self.headers = {'authorization': f'Token {self.user.get_token().key}'}
+
+    def test_should_retrieve(self):
+        response = asyncio.run(self.client.get(f'/articles/{self.article.id}/', **self.headers))
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.json()['id']).is_equal_to(self.article.id)
+        assert_that(response.json()['notes']).is_length(3)
+
+    def test_should_get_own_list_concurrently(self):
+        async def get_own_lists():
+            return await asyncio.gather(*[self.client.get('/articles/my-list/', **self.headers) for _ in range(5)])
+
+        responses = asyncio.run(get_own_lists())
+
+        for response in responses:
+            assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+            assert_that([article['id'] for article in response.json()]).is_equal_to([self.article.id])
+
+    def test_should_get_filtered_note_list(self):
+        response = asyncio.run(self.client.get(f'/notes/?article={self.article.id}', **self.headers))
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.json()).is_length(3)
+
+    def test_should_not_retrieve_unauthorized(self):
+        response = asyncio.run(AsyncClient().get(f'/articles/{self.article.id}/'))
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,141 @@
+import json
+
+from assertpy import assert_that
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Note, Connection
+
+
+class BatchTestCase(APITestCase):
+    def test_should_apply_batch(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=4)
+        connections = [
+            baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1]),
+            baker.make('articles.Connection', article=article, left_note=notes[1], right_note=notes[2]),
+        ]
+        batch_data = {
+            'notes': {
+                'create': [{'contents': 'first created'}, {'contents': 'second created'}],
+                'update': [{'id': notes[0].id, 'contents': 'changed contents'}],
+                'delete': [notes[3].id],
+            },
+            'connections': {
+                'create': [{'left_note': notes[0].id, 'right_note': notes[2].id, 'reason': 'created reason'}],
+                'update': [{'id': connections[0].id, 'reason': 'changed reason'}],
+                'delete': [connections[1].id],
+            },
+        }
+
+        self.client.force_authenticate(user=user)
+        response = self.client.post(f'/articles/{article.id}/batch/', data=json.dumps(batch_data),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['created_notes']).is_length(2)
+        assert_that(response.data['created_connections']).is_length(1)
+
+        assert_that(Note.objects.filter(article=article, contents__endswith='created').count()).is_equal_to(2)
+        assert_that(Note.objects.get(id=notes[0].id).contents).is_equal_to('changed contents')
+        assert_that(Note.objects.filter(id=notes[3].id).exists()).is_false()
+
+        assert_that(Connection.objects.filter(
+            article=article, left_note=notes[0], right_note=notes[2], reason='created reason',
+        ).exists()).is_true()
+        assert_that(Connection.objects.get(id=connections[0].id).reason).is_equal_to('changed reason')
+        assert_that(Connection.objects.filter(id=connections[1].id).exists()).is_false()
+
+    def test_should_apply_batch_in_fixed_number_of_queries(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=10)
+        batch_data = {
+            'notes': {
+                'create': [{'contents': f'created {index}'} for index in range(10)],
+                'update': [{'id': note.id, 'contents': 'changed contents'} for note in notes],
+            },
+            'connections': {
+                'create': [
+                    {'left_note': left_note.id, 'right_note': right_note.id}
+                    for left_note, right_note in zip(notes, notes[1:])
+                ],
+            },
+        }
+
+        self.client.force_authenticate(user=user)
+        with self.assertNumQueries(8):
+            response = self.client.post(f'/articles/{article.id}/batch/', data=json.dumps(batch_data),
+                                        content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+
+    def test_should_not_apply_batch_when_notes_are_not_match_with_article(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        note = baker.make('articles.Note', article=article, contents='origin contents')
+        another_article_note = baker.make('articles.Note')
+        batch_data = {
+            'notes': {
+                'update': [{'id': note.id, 'contents': 'changed contents'}],
+                'delete': [another_article_note.id],
+            },
+        }
+
+        self.client.force_authenticate(user=user)
+        response = self.client.post(f'/articles/{article.id}/batch/', data=json.dumps(batch_data),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(response.data['non_field_errors'][0]).is_equal_to('notes and article are not matched')
+        assert_that(Note.objects.get(id=note.id).contents).is_equal_to('origin contents')
+        assert_that(Note.objects.filter(id=another_article_note.id).exists()).is_true()
+
+    def test_should_not_apply_batch_when_notes_are_same(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        note = baker.make('articles.Note', article=article)
+        batch_data = {
+            'connections': {
+                'create': [{'left_note': note.id, 'right_note': note.id}],
+            },
+        }
+
+        self.client.force_authenticate(user=user)
+        response = self.client.post(f'/articles/{article.id}/batch/', data=json.dumps(batch_data),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(response.data['non_field_errors'][0]).is_equal_to("notes can't be same")
+
+    def test_should_not_apply_batch_unauthorized(self):
+        article = baker.make('articles.Article')
+        batch_data = {
+            'notes': {
+                'create': [{'contents': 'created'}],
+            },
+        }
+
+        response = self.client.post(f'/articles/{article.id}/batch/', data=json.dumps(batch_data),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_401_UNAUTHORIZED)
+        assert_that(Note.objects.filter(article=article).exists()).is_false()
+
+    def test_should_not_apply_batch_forbidden(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article')
+        batch_data = {
+            'notes': {
+                'create': [{'contents': 'created'}],
+            },
+        }
+
+        self.client.force_authenticate(user=user)
+        response = self.client.post(f'/articles/{article.id}/batch/', data=json.dumps(batch_data),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
+        assert_that(Note.objects.filter(article=article).exists()).is_false()
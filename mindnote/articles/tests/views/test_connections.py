@@ -5,7 +5,7 @@ from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from articles.models import Connection
+from articles.models import Article, Connection
 
 
 class ConnectionViewSetTestCase(APITestCase):
@@ -79,6 +79,43 @@ class ConnectionViewSetTestCase(APITestCase):
         assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
         assert_that(response.data['non_field_errors'][0]).is_equal_to('notes and article are not matched')
 
+    def test_should_not_create_connection_when_already_exists(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        connection_data = {
+            'article': article.id,
+            'left_note': notes[0].id,
+            'right_note': notes[1].id,
+            'reason': 'test reason',
+        }
+
+        self.client.force_authenticate(user=user)
+        response = self.client.post('/connections/', data=json.dumps(connection_data), content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(response.data[0]).is_equal_to('connection already exists')
+        assert_that(Connection.objects.filter(article=article)).is_length(1)
+
+    def test_should_not_create_connection_when_reversed_connection_exists(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        connection_data = {
+            'article': article.id,
+            'left_note': notes[1].id,
+            'right_note': notes[0].id,
+        }
+
+        self.client.force_authenticate(user=user)
+        response = self.client.post('/connections/', data=json.dumps(connection_data), content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(response.data[0]).is_equal_to('connection already exists')
+        assert_that(Connection.objects.filter(article=article)).is_length(1)
+
     def test_should_not_create_connection(self):
         user = baker.make('users.User')
         notes = baker.make('articles.Note', _quantity=2)
@@ -112,6 +149,70 @@ class ConnectionViewSetTestCase(APITestCase):
         assert_that(changed_connection.reason).is_equal_to(update_data['reason'])
         self._assert_connection(response.data, changed_connection)
 
+    def test_should_update_connection_notes_without_article(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=4)
+        connection = baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+
+        self.client.force_authenticate(user=user)
+        response = self.client.patch(f'/connections/{connection.id}/',
+                                     data=json.dumps({'left_note': notes[2].id, 'right_note': notes[3].id}),
+                                     content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        changed_connection = Connection.objects.get(id=connection.id)
+        assert_that(changed_connection.left_note_id).is_equal_to(notes[2].id)
+        assert_that(changed_connection.right_note_id).is_equal_to(notes[3].id)
+
+    def test_should_not_update_connection_when_notes_are_not_match_with_articles(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        connection = baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        another_article_note = baker.make('articles.Note', article__user=user)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.patch(f'/connections/{connection.id}/',
+                                     data=json.dumps({'right_note': another_article_note.id}),
+                                     content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(Connection.objects.get(id=connection.id).right_note_id).is_equal_to(notes[1].id)
+
+    def test_should_not_update_connection_article_only_when_notes_are_not_match(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        connection = baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+        another_article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.patch(f'/connections/{connection.id}/',
+                                     data=json.dumps({'article': another_article.id}),
+                                     content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+        assert_that(Connection.objects.get(id=connection.id).article_id).is_equal_to(article.id)
+
+    def test_should_move_connection_counter_to_another_article(self):
+        user = baker.make('users.User')
+        article, another_article = baker.make('articles.Article', user=user, connection_count=1, _quantity=2)
+        notes = baker.make('articles.Note', article=article, _quantity=2)
+        another_notes = baker.make('articles.Note', article=another_article, _quantity=2)
+        connection = baker.make('articles.Connection', article=article, left_note=notes[0], right_note=notes[1])
+
+        self.client.force_authenticate(user=user)
+        response = self.client.patch(f'/connections/{connection.id}/', data=json.dumps({
+            'article': another_article.id,
+            'left_note': another_notes[0].id,
+            'right_note': another_notes[1].id,
+        }), content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(Article.objects.get(id=article.id).connection_count).is_equal_to(0)
+        assert_that(Article.objects.get(id=another_article.id).connection_count).is_equal_to(2)
+
     def test_should_not_update_connection_unauthorized(self):
         origin_connection = baker.make('articles.Connection')
         update_data = {
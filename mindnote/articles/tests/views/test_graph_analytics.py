@@ -0,0 +1,97 @@
+import json
+
+from assertpy import assert_that
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.graphs import ArticleGraph
+from articles.tests.fixtures import make_article
+
+
+class GraphAnalyticsTestCase(APITestCase):
+    def setUp(self):
+        self.user, self.article, self.notes, _ = make_article(6, ((0, 1), (1, 2), (2, 0), (3, 4)))
+
+        self.client.force_authenticate(user=self.user)
+
+    def test_should_get_degree_ranking(self):
+        response = self.client.get(f'/articles/{self.article.id}/graph/degrees/?limit=2')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data).is_equal_to([
+            {'note': self.notes[0].id, 'degree': 2},
+            {'note': self.notes[1].id, 'degree': 2},
+        ])
+
+    def test_should_get_components(self):
+        response = self.client.get(f'/articles/{self.article.id}/graph/components/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data).is_equal_to([
+            [self.notes[0].id, self.notes[1].id, self.notes[2].id],
+            [self.notes[3].id, self.notes[4].id],
+            [self.notes[5].id],
+        ])
+
+    def test_should_get_orphans(self):
+        response = self.client.get(f'/articles/{self.article.id}/graph/orphans/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data).is_equal_to([self.notes[5].id])
+
+    def test_should_get_shortest_path(self):
+        response = self.client.get(
+            f'/articles/{self.article.id}/graph/shortest-path/?source={self.notes[0].id}&target={self.notes[2].id}',
+        )
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['path']).is_equal_to([self.notes[0].id, self.notes[2].id])
+
+    def test_should_get_empty_shortest_path_when_notes_are_not_connected(self):
+        response = self.client.get(
+            f'/articles/{self.article.id}/graph/shortest-path/?source={self.notes[0].id}&target={self.notes[3].id}',
+        )
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['path']).is_none()
+
+    def test_should_not_get_shortest_path_when_notes_are_not_match_with_article(self):
+        another_article_note = baker.make('articles.Note')
+
+        response = self.client.get(
+            f'/articles/{self.article.id}/graph/shortest-path/'
+            f'?source={self.notes[0].id}&target={another_article_note.id}',
+        )
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+
+    def test_should_reuse_graph_until_article_is_changed(self):
+        with self.assertNumQueries(4):
+            self.client.get(f'/articles/{self.article.id}/graph/components/')
+        with self.assertNumQueries(2):
+            self.client.get(f'/articles/{self.article.id}/graph/orphans/')
+
+        self.client.post('/connections/', data=json.dumps({
+            'article': self.article.id,
+            'left_note': self.notes[4].id,
+            'right_note': self.notes[5].id,
+        }), content_type='application/json')
+        response = self.client.get(f'/articles/{self.article.id}/graph/orphans/')
+
+        assert_that(response.data).is_equal_to([])
+
+    def test_should_ignore_connections_to_unknown_notes(self):
+        graph = ArticleGraph([1, 2, 5], [(1, 2), (2, 3), (4, 5)])
+
+        assert_that(graph.degree_ranking()).is_equal_to([
+            {'note': 1, 'degree': 1}, {'note': 2, 'degree': 1}, {'note': 5, 'degree': 0},
+        ])
+
+    def test_should_not_get_graph_analytics_forbidden(self):
+        another_user = baker.make('users.User')
+
+        self.client.force_authenticate(user=another_user)
+        response = self.client.get(f'/articles/{self.article.id}/graph/components/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
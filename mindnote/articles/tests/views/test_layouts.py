@@ -0,0 +1,88 @@
+import json
+
+from assertpy import assert_that
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.graphs import ArticleGraph
+from articles.layouts import layout_article
+from articles.models import Note
+from articles.tests.fixtures import make_article, chain
+
+
+class LayoutTestCase(APITestCase):
+    def setUp(self):
+        self.user, self.article, self.notes, _ = make_article(5, chain(5))
+
+        self.client.force_authenticate(user=self.user)
+
+    def test_should_layout_and_return_positions_in_retrieve(self):
+        response = self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({'mode': 'full'}),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that([position['id'] for position in response.data]).is_equal_to([note.id for note in self.notes])
+        assert_that(len({(position['position_x'], position['position_y']) for position in response.data})) \
+            .is_equal_to(len(self.notes))
+
+        response = self.client.get(f'/articles/{self.article.id}/')
+
+        assert_that(response.data['notes'][0]['position_x']).is_not_none()
+        assert_that(response.data['notes'][0]['position_y']).is_not_none()
+
+    def test_should_keep_positioned_notes_in_incremental_layout(self):
+        self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({'mode': 'full'}),
+                         content_type='application/json')
+        positions = dict(Note.objects.filter(article=self.article).values_list('id', 'position_x'))
+        new_note = baker.make('articles.Note', article=self.article)
+        baker.make('articles.Connection', article=self.article, left_note=self.notes[-1], right_note=new_note)
+
+        response = self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({}),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        for position in response.data:
+            if position['id'] == new_note.id:
+                assert_that(position['position_x']).is_not_none()
+            else:
+                assert_that(position['position_x']).is_equal_to(positions[position['id']])
+
+    def test_should_write_only_moved_notes_in_incremental_layout(self):
+        self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({'mode': 'full'}),
+                         content_type='application/json')
+        new_note = baker.make('articles.Note', article=self.article)
+        baker.make('articles.Connection', article=self.article, left_note=self.notes[-1], right_note=new_note)
+        since = timezone.now()
+
+        with self.assertNumQueries(8):
+            self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({}),
+                             content_type='application/json')
+        response = self.client.get(f'/articles/{self.article.id}/changes/', {'since': since.isoformat()})
+
+        assert_that([note['id'] for note in response.data['notes']]).is_equal_to([new_note.id])
+
+    def test_should_layout_notes_of_stale_graph_only(self):
+        graph = ArticleGraph.load(self.article)
+        late_note = baker.make('articles.Note', article=self.article)
+
+        positions = layout_article(self.article, graph)
+
+        assert_that([position['id'] for position in positions]).is_equal_to([note.id for note in self.notes])
+        assert_that(Note.objects.get(id=late_note.id).position_x).is_none()
+
+    def test_should_not_layout_with_invalid_mode(self):
+        response = self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({'mode': 'circle'}),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+
+    def test_should_not_layout_forbidden(self):
+        another_user = baker.make('users.User')
+
+        self.client.force_authenticate(user=another_user)
+        response = self.client.post(f'/articles/{self.article.id}/layout/', data=json.dumps({}),
+                                    content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
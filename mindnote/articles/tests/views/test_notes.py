@@ -5,7 +5,7 @@ from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from articles.models import Note
+from articles.models import Article, Note
 
 
 class NotesViewSetTestCase(APITestCase):
@@ -78,6 +78,20 @@ class NotesViewSetTestCase(APITestCase):
         for response_note, expected_note in zip(response.data, notes):
             self._assert_note(response_note, expected_note)
 
+    def test_should_get_filtered_list_with_cursor_pagination(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        notes = baker.make('articles.Note', article=article, _quantity=5)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/notes/?article={article.id}&page_size=2&fields=id,contents')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['results']).is_equal_to([
+            {'id': note.id, 'contents': note.contents} for note in notes[:2]
+        ])
+        assert_that(response.data['next']).is_not_none()
+
     def test_should_not_get_list_without_filter(self):
         user = baker.make('users.User')
         article = baker.make('articles.Article', user=user)
@@ -116,6 +130,19 @@ class NotesViewSetTestCase(APITestCase):
         assert_that(changed_note.contents).is_equal_to(update_data['contents'])
         self._assert_note(response.data, changed_note)
 
+    def test_should_move_note_counter_to_another_article(self):
+        user = baker.make('users.User')
+        article, another_article = baker.make('articles.Article', user=user, note_count=1, _quantity=2)
+        note = baker.make('articles.Note', article=article)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.patch(f'/notes/{note.id}/', data=json.dumps({'article': another_article.id}),
+                                     content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(Article.objects.get(id=article.id).note_count).is_equal_to(0)
+        assert_that(Article.objects.get(id=another_article.id).note_count).is_equal_to(2)
+
     def test_should_not_update_unauthorized(self):
         note = baker.make('articles.Note')
         update_data = {
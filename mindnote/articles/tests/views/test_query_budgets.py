@@ -0,0 +1,139 @@
+import json
+
+from assertpy import assert_that
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.tests.fixtures import make_article, chain
+
+
+class QueryBudgetTestCase(APITestCase):
+    graph_size = 20
+
+    def setUp(self):
+        self.user, self.article, self.notes, self.connections = make_article(self.graph_size, chain(self.graph_size))
+
+        self.client.force_authenticate(user=self.user)
+
+    def test_article_create(self):
+        article_data = {
+            'subject': 'test subject',
+        }
+
+        with self.assertNumQueries(2):
+            response = self.client.post('/articles/', data=json.dumps(article_data), content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_201_CREATED)
+
+    def test_article_my_list(self):
+        baker.make('articles.Article', user=self.user, _quantity=self.graph_size)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/articles/my-list/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+
+    def test_article_retrieve(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(f'/articles/{self.article.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['notes']).is_length(self.graph_size)
+        assert_that(response.data['connections']).is_length(self.graph_size - 1)
+
+    def test_article_retrieve_not_modified(self):
+        etag = self.client.get(f'/articles/{self.article.id}/')['ETag']
+
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/articles/{self.article.id}/', HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_304_NOT_MODIFIED)
+
+    def test_article_graph(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/articles/{self.article.id}/graph/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['note_ids']).is_length(self.graph_size)
+
+    def test_article_changes(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(f'/articles/{self.article.id}/changes/',
+                                       {'since': self.article.created_at.isoformat()})
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['notes']).is_length(self.graph_size)
+
+    def test_article_update(self):
+        with self.assertNumQueries(2):
+            response = self.client.patch(f'/articles/{self.article.id}/',
+                                         data=json.dumps({'subject': 'changed subject'}),
+                                         content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+
+    def test_article_destroy(self):
+        with self.assertNumQueries(7):
+            response = self.client.delete(f'/articles/{self.article.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_204_NO_CONTENT)
+
+    def test_note_create(self):
+        note_data = {
+            'article': self.article.id,
+            'contents': 'test contents',
+        }
+
+        with self.assertNumQueries(5):
+            response = self.client.post('/notes/', data=json.dumps(note_data), content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_201_CREATED)
+
+    def test_note_list(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/notes/?article={self.article.id}')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data).is_length(self.graph_size)
+
+    def test_note_update(self):
+        with self.assertNumQueries(5):
+            response = self.client.patch(f'/notes/{self.notes[0].id}/',
+                                         data=json.dumps({'contents': 'changed contents'}),
+                                         content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+
+    def test_note_destroy(self):
+        with self.assertNumQueries(10):
+            response = self.client.delete(f'/notes/{self.notes[-1].id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_204_NO_CONTENT)
+
+    def test_connection_create(self):
+        connection_data = {
+            'article': self.article.id,
+            'left_note': self.notes[0].id,
+            'right_note': self.notes[-1].id,
+        }
+
+        with self.assertNumQueries(9):
+            response = self.client.post('/connections/', data=json.dumps(connection_data),
+                                        content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_201_CREATED)
+
+    def test_connection_update(self):
+        with self.assertNumQueries(7):
+            response = self.client.patch(f'/connections/{self.connections[0].id}/',
+                                         data=json.dumps({'reason': 'changed reason'}),
+                                         content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+
+    def test_connection_destroy(self):
+        with self.assertNumQueries(6):
+            response = self.client.delete(f'/connections/{self.connections[0].id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_204_NO_CONTENT)
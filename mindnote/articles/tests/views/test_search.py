@@ -0,0 +1,97 @@
+import json
+import unittest
+
+from assertpy import assert_that
+from django.db import connection
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Article, Note
+from articles.search import ArticleSearchWithPostgres, ArticleSearchWithInvertedIndex
+from articles.tests.fixtures import make_article
+
+
+class SearchTestCase(APITestCase):
+    def setUp(self):
+        self.user, self.article, _, _ = make_article(subject='graph theory', description='', body='')
+        self.note = baker.make('articles.Note', article=self.article, contents='graph graph coloring')
+        baker.make('articles.Note', article=self.article, contents='unrelated contents')
+        baker.make('articles.Note', contents='graph of another user')
+
+        self.client.force_authenticate(user=self.user)
+
+    def test_should_search_own_articles_and_notes_by_rank(self):
+        response = self.client.get('/articles/search/?q=graph')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that([(result['kind'], result['id']) for result in response.data['results']]).is_equal_to([
+            ('note', self.note.id),
+            ('article', self.article.id),
+        ])
+        assert_that(response.data['results'][0]['article']).is_equal_to(self.article.id)
+        assert_that(response.data['next_page']).is_none()
+
+    def test_should_match_all_terms(self):
+        response = self.client.get('/articles/search/?q=graph%20coloring')
+
+        assert_that([result['id'] for result in response.data['results']]).is_equal_to([self.note.id])
+
+    def test_should_paginate(self):
+        response = self.client.get('/articles/search/?q=graph&page_size=1')
+
+        assert_that(response.data['results']).is_length(1)
+        assert_that(response.data['next_page']).is_equal_to(2)
+
+        response = self.client.get('/articles/search/?q=graph&page_size=1&page=2')
+
+        assert_that(response.data['results'][0]['id']).is_equal_to(self.article.id)
+        assert_that(response.data['next_page']).is_none()
+
+    def test_should_find_written_notes(self):
+        self.client.patch(f'/notes/{self.note.id}/', data=json.dumps({'contents': 'planar maps'}),
+                          content_type='application/json')
+
+        response = self.client.get('/articles/search/?q=planar')
+
+        assert_that([result['id'] for result in response.data['results']]).is_equal_to([self.note.id])
+
+    def test_should_not_search_without_query(self):
+        response = self.client.get('/articles/search/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
+
+    def test_should_not_search_unauthorized(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get('/articles/search/?q=graph')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_401_UNAUTHORIZED)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'requires postgresql')
+    def test_should_search_with_gin_indexes(self):
+        articles = Article.objects.bulk_create(
+            Article(user=self.user, subject=f'subject {index}', description='', body='') for index in range(1000)
+        )
+        Note.objects.bulk_create(Note(article=article, contents=f'contents {article.id}') for article in articles)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE articles_article, articles_note')
+            cursor.execute('SET enable_seqscan = off')
+        try:
+            plan = ArticleSearchWithPostgres.get_queryset(self.user, 'graph').explain()
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute('RESET enable_seqscan')
+
+        assert_that(plan).contains('articles_article_search_idx', 'articles_note_search_idx')
+
+    @override_settings(ARTICLE_SEARCH_INDEX_CACHE={'TIMEOUT': 300, 'MAX_SIZE': 1})
+    def test_should_keep_bounded_inverted_indexes(self):
+        search = ArticleSearchWithInvertedIndex()
+        other_user = baker.make('users.User')
+
+        index = search.get_index(self.user)
+        search.get_index(other_user)
+
+        assert_that(search._indexes).is_length(1)
+        assert_that(search.get_index(self.user)).is_not_same_as(index)
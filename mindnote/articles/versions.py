@@ -0,0 +1,45 @@
+import hashlib
+from collections import namedtuple
+
+from django.db.models import OuterRef, Subquery, Max, Count
+from django.utils.http import http_date
+
+from articles.models import Article, Note, Connection
+
+ArticleVersion = namedtuple('ArticleVersion', ('etag', 'last_modified'))
+
+
+def _aggregate_subquery(model, aggregate):
+    return Subquery(
+        model.objects.filter(article=OuterRef('pk')).order_by().values('article')
+        .annotate(value=aggregate).values('value')
+    )
+
+
+def get_article_version(article):
+    version = Article.objects.filter(pk=article.pk).values('updated_at').annotate(
+        notes_updated_at=_aggregate_subquery(Note, Max('updated_at')),
+        note_count=_aggregate_subquery(Note, Count('id')),
+        connections_updated_at=_aggregate_subquery(Connection, Max('updated_at')),
+        connection_count=_aggregate_subquery(Connection, Count('id')),
+    ).get()
+
+    timestamps = [
+        timestamp
+        for timestamp in (version['updated_at'], version['notes_updated_at'], version['connections_updated_at'])
+        if timestamp is not None
+    ]
+    last_modified = max(timestamps) if timestamps else None
+
+    version_key = ':'.join(str(value) for value in (article.pk, *version.values()))
+    etag = f'"{hashlib.md5(version_key.encode()).hexdigest()}"'
+
+    return ArticleVersion(etag=etag, last_modified=last_modified)
+
+
+def set_version_headers(response, version):
+    response['ETag'] = version.etag
+    if version.last_modified is not None:
+        response['Last-Modified'] = http_date(version.last_modified.timestamp())
+
+    return response
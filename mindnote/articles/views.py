@@ -1,24 +1,38 @@
+from django.db.models import prefetch_related_objects
+from django.utils.cache import get_conditional_response
 from django_filters.rest_framework import DjangoFilterBackend
 from django_rest_framework_mango.mixins import PermissionMixin, QuerysetMixin, SerializerMixin
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.mixins import UpdateModelMixin, DestroyModelMixin, RetrieveModelMixin, CreateModelMixin, \
     ListModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from articles.caches import ArticleCache
+from articles.changes import delete_graph_objects, get_article_changes, delete_articles
+from articles.graphs import get_graph_payload, ArticleGraph
+from articles.layouts import layout_article
+from articles.mixins import InvalidateArticleCacheMixin, RecordArticleActivityMixin
 from articles.models import Article, Note, Connection
-from articles.serializers import ArticleSerializer, NoteSerializer, RetrieveArticleSerializer, ConnectionSerializer
-from commons.mixins import CreateWithRequestUserMixin, MyListMixin
+from articles.search import ArticleSearch
+from articles.serializers import ArticleSerializer, NoteSerializer, RetrieveArticleSerializer, ConnectionSerializer, \
+    BatchSerializer, ChangesQuerySerializer, ChangesSerializer, GraphDegreesQuerySerializer, \
+    GraphShortestPathQuerySerializer, LayoutSerializer, SearchQuerySerializer
+from articles.versions import get_article_version, set_version_headers
+from commons.mixins import CreateWithRequestUserMixin, MyListMixin, SparseFieldsetMixin
+from commons.paginations import CreatedAtCursorPagination
+from commons.timings import timing
 
 
 class IsOwner(permissions.BasePermission):
     def has_object_permission(self, request, views, obj):
-        return obj.user.id == request.user.id
+        return obj.user_id == request.user.id
 
 
 class ArticleViewSet(
-    QuerysetMixin, PermissionMixin, SerializerMixin,
+    InvalidateArticleCacheMixin, SparseFieldsetMixin, QuerysetMixin, PermissionMixin, SerializerMixin,
     CreateWithRequestUserMixin, MyListMixin, RetrieveModelMixin, UpdateModelMixin, DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
@@ -31,37 +45,170 @@ class ArticleViewSet(
     permission_by_actions = {
         'create': (IsAuthenticated,),
         'my_list': (IsAuthenticated,),
+        'search': (IsAuthenticated,),
     }
+    pagination_class = CreatedAtCursorPagination
+    article_id_field = 'id'
 
-    @action(detail=False, methods=['get'], url_path='my-list')
-    def my_list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+    def retrieve(self, request, *args, **kwargs):
+        article = self.get_object()
+        version = get_article_version(article)
+
+        last_modified = int(version.last_modified.timestamp()) if version.last_modified else None
+        not_modified_response = get_conditional_response(request, etag=version.etag, last_modified=last_modified)
+        if not_modified_response is not None:
+            return set_version_headers(not_modified_response, version)
+
+        article_cache = ArticleCache.instance()
+        data = article_cache.get(article.id, version.etag)
+        if data is None:
+            prefetch_related_objects([article], 'notes', 'connections')
+            with timing('serialize'):
+                data = dict(self.get_serializer(article).data)
+            article_cache.set(article.id, version.etag, data)
+
+        return set_version_headers(Response(data), version)
+
+    def perform_destroy(self, instance):
+        delete_articles([instance.id])
+
+    @action(detail=True, methods=['get'])
+    def graph(self, request, *args, **kwargs):
+        article = self.get_object()
+
+        return Response(get_graph_payload(article))
+
+    def graph_queryset(self, queryset):
+        return queryset.only('id', 'user')
+
+    def get_article_graph(self):
+        article = self.get_object()
+
+        return ArticleGraph.for_article(article, get_article_version(article).etag)
+
+    @action(detail=True, methods=['get'], url_path='graph/degrees')
+    def graph_degrees(self, request, *args, **kwargs):
+        query_serializer = GraphDegreesQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        graph = self.get_article_graph()
+
+        return Response(graph.degree_ranking(limit=query_serializer.validated_data.get('limit')))
+
+    def graph_degrees_queryset(self, queryset):
+        return self.graph_queryset(queryset)
+
+    @action(detail=True, methods=['get'], url_path='graph/components')
+    def graph_components(self, request, *args, **kwargs):
+        graph = self.get_article_graph()
+
+        return Response(graph.components())
+
+    def graph_components_queryset(self, queryset):
+        return self.graph_queryset(queryset)
+
+    @action(detail=True, methods=['get'], url_path='graph/orphans')
+    def graph_orphans(self, request, *args, **kwargs):
+        graph = self.get_article_graph()
+
+        return Response(graph.orphans())
+
+    def graph_orphans_queryset(self, queryset):
+        return self.graph_queryset(queryset)
+
+    @action(detail=True, methods=['get'], url_path='graph/shortest-path')
+    def graph_shortest_path(self, request, *args, **kwargs):
+        query_serializer = GraphShortestPathQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        source = query_serializer.validated_data['source']
+        target = query_serializer.validated_data['target']
+
+        graph = self.get_article_graph()
+        if not graph.has_note(source) or not graph.has_note(target):
+            raise ValidationError(detail='notes and article are not matched')
+
+        return Response({'path': graph.shortest_path(source, target)})
+
+    def graph_shortest_path_queryset(self, queryset):
+        return self.graph_queryset(queryset)
+
+    @action(detail=True, methods=['post'])
+    def layout(self, request, *args, **kwargs):
+        article = self.get_object()
+        serializer = LayoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        graph = ArticleGraph.for_article(article, get_article_version(article).etag)
+        incremental = serializer.validated_data['mode'] == 'incremental'
+
+        return Response(layout_article(article, graph, incremental=incremental))
+
+    def layout_queryset(self, queryset):
+        return self.graph_queryset(queryset)
+
+    @action(detail=False, methods=['get'])
+    def search(self, request, *args, **kwargs):
+        query_serializer = SearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        page = query_serializer.validated_data['page']
+        page_size = query_serializer.validated_data['page_size']
+
+        results = ArticleSearch.instance().search(
+            request.user, query_serializer.validated_data['q'], offset=(page - 1) * page_size, limit=page_size + 1,
+        )
+
+        return Response({
+            'results': results[:page_size],
+            'next_page': page + 1 if len(results) > page_size else None,
+        })
+
+    @action(detail=True, methods=['post'])
+    def batch(self, request, *args, **kwargs):
+        article = self.get_object()
+        serializer = BatchSerializer(data=request.data, context={'request': request, 'article': article})
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.invalidate_article_cache(article.id)
 
         return Response(serializer.data)
 
-    def my_list_queryset(self, queryset):
-        return queryset.filter(user=self.request.user.id)
+    def batch_queryset(self, queryset):
+        return queryset.only('id', 'user')
+
+    @action(detail=True, methods=['get'])
+    def changes(self, request, *args, **kwargs):
+        article = self.get_object()
+        query_serializer = ChangesQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        changes = get_article_changes(article, query_serializer.validated_data['since'])
+
+        return Response(ChangesSerializer(changes).data)
+
+    def changes_queryset(self, queryset):
+        return queryset.only('id', 'user')
 
 
 class IsArticleOwnerUserOnly(permissions.BasePermission):
     def has_object_permission(self, request, views, obj):
-        return obj.article.user == request.user
+        return obj.article.user_id == request.user.id
 
 
 class NoteViewSet(
-    QuerysetMixin, PermissionMixin,
+    RecordArticleActivityMixin, InvalidateArticleCacheMixin, SparseFieldsetMixin, QuerysetMixin, PermissionMixin,
     CreateModelMixin, ListModelMixin, UpdateModelMixin, DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
     queryset = Note.objects.all()
     serializer_class = NoteSerializer
+    article_counter_field = 'note_count'
     permission_classes = (IsArticleOwnerUserOnly,)
     permission_by_actions = {
         'list': (IsAuthenticated,),
     }
     filter_backends = (DjangoFilterBackend,)
     filterset_fields = ('article',)
+    pagination_class = CreatedAtCursorPagination
 
     def list(self, request, *args, **kwargs):
         if 'article' not in request.query_params:
@@ -69,12 +216,37 @@ class NoteViewSet(
             return Response(status=status.HTTP_400_BAD_REQUEST)
         return super().list(request, *args, **kwargs)
 
+    def update_queryset(self, queryset):
+        return queryset.select_related('article').defer('article__body')
+
+    def partial_update_queryset(self, queryset):
+        return self.update_queryset(queryset)
+
+    def destroy_queryset(self, queryset):
+        return self.update_queryset(queryset)
+
+    def perform_destroy(self, instance):
+        delete_graph_objects(instance.article_id, note_ids=[instance.id])
+
 
 class ConnectionViewSet(
-    QuerysetMixin, PermissionMixin,
+    RecordArticleActivityMixin, InvalidateArticleCacheMixin, QuerysetMixin, PermissionMixin,
     CreateModelMixin, UpdateModelMixin, DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
     queryset = Connection.objects.all()
     serializer_class = ConnectionSerializer
+    article_counter_field = 'connection_count'
     permission_classes = (IsArticleOwnerUserOnly,)
+
+    def update_queryset(self, queryset):
+        return queryset.select_related('article').defer('article__body')
+
+    def partial_update_queryset(self, queryset):
+        return self.update_queryset(queryset)
+
+    def destroy_queryset(self, queryset):
+        return self.update_queryset(queryset)
+
+    def perform_destroy(self, instance):
+        delete_graph_objects(instance.article_id, connection_ids=[instance.id])
@@ -0,0 +1,47 @@
+import json
+import platform
+from collections import namedtuple
+
+import django
+from django.db import connection
+from django.utils import timezone
+
+Comparison = namedtuple('Comparison', ('name', 'baseline_ms', 'current_ms', 'ratio', 'regressed'))
+
+
+def get_metadata(profile, seed):
+    return {
+        'profile': profile,
+        'seed': seed,
+        'vendor': connection.vendor,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'created_at': timezone.now().isoformat(),
+    }
+
+
+def save_baseline(path, metadata, results):
+    with open(path, 'w') as baseline_file:
+        json.dump({
+            'metadata': metadata,
+            'results': {name: result._asdict() for name, result in results.items()},
+        }, baseline_file, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare(baseline_results, current_results, threshold=0.2, minimum_delta_ms=1.0):
+    comparisons = []
+    for name, result in current_results.items():
+        if name not in baseline_results:
+            continue
+
+        baseline_ms = baseline_results[name]['median_ms']
+        ratio = result.median_ms / baseline_ms if baseline_ms else float('inf')
+        regressed = ratio > 1 + threshold and result.median_ms - baseline_ms > minimum_delta_ms
+        comparisons.append(Comparison(name, baseline_ms, result.median_ms, ratio, regressed))
+
+    return comparisons
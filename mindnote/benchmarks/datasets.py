@@ -0,0 +1,85 @@
+import itertools
+import random
+import secrets
+from collections import namedtuple
+
+from django.db import transaction
+from model_bakery import baker
+
+from articles.changes import delete_articles
+from articles.counters import repair_article_counters
+from articles.models import Article, Note, Connection
+from users.models import User
+
+PROFILES = {
+    'small': (10, 100, 1000),
+    'default': (10, 100, 1000, 10000),
+    'large': (10, 100, 1000, 10000, 50000),
+}
+CROSS_LINK_RATIO = 0.1
+
+Dataset = namedtuple('Dataset', ('user', 'password', 'articles'))
+
+
+class DatasetGenerator:
+    def __init__(self, seed=0, vocabulary_size=5000, words_per_note=(3, 20)):
+        self.random = random.Random(seed)
+        self.vocabulary = [f'w{index}z' for index in range(vocabulary_size)]
+        self.cumulative_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(vocabulary_size)))
+        self.words_per_note = words_per_note
+        self.created_user_ids = []
+
+    def close(self):
+        with transaction.atomic():
+            delete_articles(Article.objects.filter(user_id__in=self.created_user_ids).values_list('id', flat=True))
+            User.objects.filter(id__in=self.created_user_ids).delete()
+
+    def generate(self, note_sizes):
+        password = secrets.token_urlsafe(16)
+        user = baker.make('users.User')
+        self.created_user_ids.append(user.id)
+        user.set_password(password)
+        user.save()
+
+        articles = {}
+        for note_size in note_sizes:
+            article = baker.make('articles.Article', user=user, subject=self.text(), description=self.text(),
+                                 body=self.text())
+            self.generate_graph(article, note_size)
+            articles[note_size] = article
+
+        repair_article_counters(Article.objects.filter(user=user))
+
+        return Dataset(user=user, password=password, articles=articles)
+
+    def generate_graph(self, article, note_size):
+        Note.objects.bulk_create(
+            baker.prepare('articles.Note', article=article, contents=(self.text() for _ in range(note_size)),
+                          _quantity=note_size),
+            batch_size=5000,
+        )
+        note_ids = list(Note.objects.filter(article=article).order_by('id').values_list('id', flat=True))
+
+        Connection.objects.bulk_create([
+            Connection(article=article, left_note_id=note_ids[left], right_note_id=note_ids[right])
+            for left, right in self.edges(len(note_ids))
+        ], batch_size=5000)
+
+    def edges(self, note_size):
+        edges = set()
+        endpoints = [0]
+        for note_index in range(1, note_size):
+            parent_index = self.random.choice(endpoints)
+            edges.add((parent_index, note_index))
+            endpoints.extend((parent_index, note_index))
+
+        for _ in range(int(note_size * CROSS_LINK_RATIO)):
+            left, right = self.random.sample(range(note_size), 2)
+            if (right, left) not in edges:
+                edges.add((left, right))
+
+        return sorted(edges)
+
+    def text(self):
+        word_count = self.random.randint(*self.words_per_note)
+        return ' '.join(self.random.choices(self.vocabulary, cum_weights=self.cumulative_weights, k=word_count))
@@ -0,0 +1,104 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from benchmarks.baselines import get_metadata, save_baseline, load_baseline, compare
+from benchmarks.datasets import PROFILES, DatasetGenerator
+from benchmarks.suites import SUITES, SKIPPED_URL_NAMES, EndpointSuite, SerializerSuite, GraphSuite, measure, \
+    get_router_url_names
+from commons.management.base import BenchmarkCommand
+
+
+class Command(BenchmarkCommand):
+    help = 'Run endpoint, serializer and graph benchmarks on a generated dataset and compare them with a baseline'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--profile', choices=PROFILES, default='default')
+        parser.add_argument('--suite', choices=SUITES, action='append', help='may be repeated, defaults to all')
+        parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--warmup', type=int, default=1)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='write the results to this json file')
+        parser.add_argument('--baseline', help='compare the results with this json file')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='fail when a median is slower than the baseline by this ratio')
+
+    def handle(self, *args, **options):
+        baseline = load_baseline(options['baseline']) if options['baseline'] else None
+        metadata = get_metadata(options['profile'], options['seed'])
+        if baseline is not None:
+            for key in ('profile', 'vendor'):
+                if baseline['metadata'][key] != metadata[key]:
+                    raise CommandError(f'baseline {key} {baseline["metadata"][key]} does not match {metadata[key]}')
+
+        generator = DatasetGenerator(seed=options['seed'])
+        suite_names = options['suite'] or SUITES
+        try:
+            started_at = time.perf_counter()
+            dataset = generator.generate(PROFILES[options['profile']])
+            self.stdout.write(f'generated {options["profile"]} dataset in {time.perf_counter() - started_at:.1f}s')
+
+            with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver'],
+                                   N_PLUS_ONE={**settings.N_PLUS_ONE, 'ENABLED': False}):
+                results = self._run(dataset, generator, suite_names, options)
+        finally:
+            generator.close()
+
+        if options['output']:
+            save_baseline(options['output'], metadata, results)
+            self.stdout.write(f'wrote {len(results)} results to {options["output"]}')
+
+        if baseline is not None:
+            self._compare(baseline, results, options['threshold'])
+
+    def _run(self, dataset, generator, suite_names, options):
+        suites = {
+            'endpoints': lambda: EndpointSuite(dataset, generator),
+            'serializers': lambda: SerializerSuite(dataset),
+            'graphs': lambda: GraphSuite(dataset),
+        }
+
+        results = {}
+        self.stdout.write(f'{"benchmark":<56}{"median (ms)":>14}{"p95 (ms)":>12}{"min (ms)":>12}')
+        for suite_name in suite_names:
+            suite = suites[suite_name]()
+            try:
+                for benchmark in suite.benchmarks():
+                    if options['filter'] not in benchmark.name:
+                        continue
+
+                    result = measure(benchmark, options['repeat'], warmup=options['warmup'])
+                    results[benchmark.name] = result
+                    self.stdout.write(
+                        f'{benchmark.name:<56}{result.median_ms:>14.2f}{result.p95_ms:>12.2f}{result.min_ms:>12.2f}'
+                    )
+            finally:
+                suite.close()
+
+            if suite_name == 'endpoints' and not options['filter']:
+                uncovered_url_names = get_router_url_names() - suite.covered_url_names - set(SKIPPED_URL_NAMES)
+                if uncovered_url_names:
+                    self.stderr.write(f'router endpoints without a benchmark: {", ".join(sorted(uncovered_url_names))}')
+
+        return results
+
+    def _compare(self, baseline, results, threshold):
+        comparisons = compare(baseline['results'], results, threshold=threshold)
+        regressions = [comparison for comparison in comparisons if comparison.regressed]
+
+        self.stdout.write(f'{"benchmark":<56}{"baseline (ms)":>14}{"current (ms)":>14}{"ratio":>8}')
+        for comparison in comparisons:
+            marker = ' !' if comparison.regressed else ''
+            self.stdout.write(
+                f'{comparison.name:<56}{comparison.baseline_ms:>14.2f}{comparison.current_ms:>14.2f}'
+                f'{comparison.ratio:>8.2f}{marker}'
+            )
+
+        if regressions:
+            raise CommandError(
+                f'{len(regressions)} benchmarks are slower than the baseline by more than {threshold:.0%}'
+            )
@@ -0,0 +1,299 @@
+import json
+import statistics
+import time
+from collections import namedtuple
+
+import numpy as np
+from django.db.models import prefetch_related_objects
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from articles.caches import ArticleCache
+from articles.graphs import ArticleGraph
+from articles.layouts import radial_layout, compute_layout, incremental_layout
+from articles.models import Article, Note, Connection
+from articles.serializers import RetrieveArticleSerializer, NoteSerializer
+from commons.renderers import CamelCaseJSONRenderer
+from mindnote.urls import router
+from users.models import User
+
+SUITES = ('endpoints', 'serializers', 'graphs')
+
+# router url names which are not measured, with the reason
+SKIPPED_URL_NAMES = {
+    'user-google': 'calls the google oauth api',
+}
+
+Benchmark = namedtuple('Benchmark', ('name', 'run', 'setup'))
+Result = namedtuple('Result', ('median_ms', 'p95_ms', 'min_ms', 'repeat'))
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def measure(benchmark, repeat, warmup=1):
+    durations = []
+    for index in range(warmup + repeat):
+        argument = benchmark.setup() if benchmark.setup else None
+
+        started_at = time.perf_counter()
+        benchmark.run(argument)
+        duration = (time.perf_counter() - started_at) * 1000
+
+        if index >= warmup:
+            durations.append(duration)
+
+    durations.sort()
+
+    return Result(
+        median_ms=round(statistics.median(durations), 3),
+        p95_ms=round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+        min_ms=round(durations[0], 3),
+        repeat=repeat,
+    )
+
+
+def get_router_url_names():
+    return {url.name for url in router.urls}
+
+
+class EndpointSuite:
+    def __init__(self, dataset, generator):
+        self.dataset = dataset
+        self.generator = generator
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {dataset.user.get_token().key}')
+        self.covered_url_names = set()
+        self.created_user_ids = []
+
+    def close(self):
+        User.objects.filter(id__in=self.created_user_ids).delete()
+
+    def path(self, url_name, **kwargs):
+        self.covered_url_names.add(url_name)
+
+        return reverse(url_name, kwargs=kwargs)
+
+    def request(self, method, path, data=None, status_code=200, client=None, **extra):
+        client = client or self.client
+        if method == 'get':
+            response = client.get(path, data, **extra)
+        else:
+            response = getattr(client, method)(path, data=json.dumps(data), content_type='application/json', **extra)
+
+        if response.status_code != status_code:
+            raise BenchmarkError(f'{method.upper()} {path} returned {response.status_code}, expected {status_code}')
+
+        return response
+
+    def benchmarks(self):
+        yield from self.user_benchmarks()
+        yield from self.article_list_benchmarks()
+        for note_size, article in self.dataset.articles.items():
+            yield from self.article_benchmarks(note_size, article)
+
+    def user_benchmarks(self):
+        user = self.dataset.user
+        counter = iter(range(10 ** 9))
+
+        def create_user(_):
+            email = f'benchmark-{user.id}-{next(counter)}@example.com'
+            response = self.request(
+                'post', self.path('user-list'),
+                {'email': email, 'password': self.dataset.password, 'name': 'benchmark'}, status_code=201,
+            )
+            self.created_user_ids.append(response.data['user']['id'])
+
+        def destroy_user_setup():
+            destroyed_user = baker.make('users.User')
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f'Token {destroyed_user.get_token().key}')
+            return destroyed_user.id, client
+
+        yield Benchmark('user-list POST', create_user, None)
+        yield Benchmark('user-tokens POST', lambda _: self.request(
+            'post', self.path('user-tokens'), {'email': user.email, 'password': self.dataset.password},
+        ), None)
+        yield Benchmark('user-my-profile GET', lambda _: self.request('get', self.path('user-my-profile')), None)
+        yield Benchmark('user-detail PATCH', lambda _: self.request(
+            'patch', self.path('user-detail', pk=user.id), {'name': 'benchmark'},
+        ), None)
+
+        yield Benchmark('user-detail DELETE', lambda argument: self.request(
+            'delete', self.path('user-detail', pk=argument[0]), status_code=204, client=argument[1],
+        ), destroy_user_setup)
+
+    def article_list_benchmarks(self):
+        query = ' '.join(self.generator.vocabulary[10:12])
+
+        def create_article(_):
+            self.request('post', self.path('article-list'), {'subject': 'benchmark'}, status_code=201)
+
+        yield Benchmark('api-root GET', lambda _: self.request('get', self.path('api-root')), None)
+        yield Benchmark('article-list POST', create_article, None)
+        yield Benchmark('article-my-list GET', lambda _: self.request('get', self.path('article-my-list')), None)
+        yield Benchmark('article-search GET', lambda _: self.request(
+            'get', self.path('article-search'), {'q': query},
+        ), None)
+
+    def article_benchmarks(self, note_size, article):
+        note_ids = list(Note.objects.filter(article=article).order_by('id').values_list('id', flat=True))
+        connection_ids = list(
+            Connection.objects.filter(article=article).order_by('id').values_list('id', flat=True)[:10]
+        )
+        detail_path = self.path('article-detail', pk=article.id)
+        etag = self.request('get', detail_path)['ETag']
+
+        def retrieve_cold_setup():
+            ArticleCache.instance().invalidate(article.id)
+
+        def destroy_setup():
+            destroyed_article = baker.make('articles.Article', user=self.dataset.user)
+            self.generator.generate_graph(destroyed_article, note_size)
+            return destroyed_article.id
+
+        def batch_setup():
+            return {
+                'notes': {
+                    'create': [{'contents': self.generator.text()} for _ in range(10)],
+                    'update': [{'id': note_id, 'contents': self.generator.text()} for note_id in note_ids[:10]],
+                },
+                'connections': {
+                    'update': [{'id': connection_id, 'reason': 'benchmark'} for connection_id in connection_ids],
+                },
+            }
+
+        def new_note_ids_setup():
+            return [note.id for note in baker.make('articles.Note', article=article, _quantity=2)]
+
+        def note_destroy_setup():
+            note = baker.make('articles.Note', article=article)
+            baker.make('articles.Connection', article=article, left_note_id=note_ids[0], right_note=note)
+            return note.id
+
+        def connection_destroy_setup():
+            left_note, right_note = baker.make('articles.Note', article=article, _quantity=2)
+            return baker.make('articles.Connection', article=article, left_note=left_note, right_note=right_note).id
+
+        benchmarks = [
+            ('article-detail GET cold', lambda _: self.request('get', detail_path), retrieve_cold_setup),
+            ('article-detail GET warm', lambda _: self.request('get', detail_path), None),
+            ('article-detail GET not-modified', lambda _: self.request(
+                'get', detail_path, status_code=304, HTTP_IF_NONE_MATCH=etag,
+            ), None),
+            ('article-detail PATCH', lambda _: self.request('patch', detail_path, {'subject': 'benchmark'}), None),
+            ('article-detail DELETE', lambda article_id: self.request(
+                'delete', self.path('article-detail', pk=article_id), status_code=204,
+            ), destroy_setup),
+            ('article-graph GET', lambda _: self.request('get', self.path('article-graph', pk=article.id)), None),
+            ('article-graph-degrees GET', lambda _: self.request(
+                'get', self.path('article-graph-degrees', pk=article.id), {'limit': 20},
+            ), None),
+            ('article-graph-components GET', lambda _: self.request(
+                'get', self.path('article-graph-components', pk=article.id),
+            ), None),
+            ('article-graph-orphans GET', lambda _: self.request(
+                'get', self.path('article-graph-orphans', pk=article.id),
+            ), None),
+            ('article-graph-shortest-path GET', lambda _: self.request(
+                'get', self.path('article-graph-shortest-path', pk=article.id),
+                {'source': note_ids[0], 'target': note_ids[-1]},
+            ), None),
+            ('article-changes GET', lambda _: self.request(
+                'get', self.path('article-changes', pk=article.id), {'since': article.created_at.isoformat()},
+            ), None),
+            ('article-batch POST', lambda batch_data: self.request(
+                'post', self.path('article-batch', pk=article.id), batch_data,
+            ), batch_setup),
+            ('article-layout POST incremental', lambda _: self.request(
+                'post', self.path('article-layout', pk=article.id), {'mode': 'incremental'},
+            ), None),
+            ('article-layout POST full', lambda _: self.request(
+                'post', self.path('article-layout', pk=article.id), {'mode': 'full'},
+            ), None),
+            ('note-list GET', lambda _: self.request('get', self.path('note-list'), {'article': article.id}), None),
+            ('note-list POST', lambda _: self.request(
+                'post', self.path('note-list'), {'article': article.id, 'contents': 'benchmark'}, status_code=201,
+            ), None),
+            ('note-detail PATCH', lambda _: self.request(
+                'patch', self.path('note-detail', pk=note_ids[0]), {'contents': 'benchmark'},
+            ), None),
+            ('note-detail DELETE', lambda note_id: self.request(
+                'delete', self.path('note-detail', pk=note_id), status_code=204,
+            ), note_destroy_setup),
+            ('connection-list POST', lambda new_note_ids: self.request(
+                'post', self.path('connection-list'),
+                {'article': article.id, 'left_note': new_note_ids[0], 'right_note': new_note_ids[1]},
+                status_code=201,
+            ), new_note_ids_setup),
+            ('connection-detail PATCH', lambda _: self.request(
+                'patch', self.path('connection-detail', pk=connection_ids[0]), {'reason': 'benchmark'},
+            ), None),
+            ('connection-detail DELETE', lambda connection_id: self.request(
+                'delete', self.path('connection-detail', pk=connection_id), status_code=204,
+            ), connection_destroy_setup),
+        ]
+
+        for name, run, setup in benchmarks:
+            yield Benchmark(f'{name} n={note_size}', run, setup)
+
+
+class SerializerSuite:
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def close(self):
+        pass
+
+    def benchmarks(self):
+        for note_size, article in self.dataset.articles.items():
+            article = Article.objects.get(id=article.id)
+            prefetch_related_objects([article], 'notes', 'connections')
+            notes = list(article.notes.all())
+            data = RetrieveArticleSerializer(article).data
+
+            yield Benchmark(f'RetrieveArticleSerializer n={note_size}',
+                            lambda _, article=article: RetrieveArticleSerializer(article).data, None)
+            yield Benchmark(f'NoteSerializer many n={note_size}',
+                            lambda _, notes=notes: NoteSerializer(notes, many=True).data, None)
+            yield Benchmark(f'CamelCaseJSONRenderer n={note_size}',
+                            lambda _, data=data: CamelCaseJSONRenderer().render(data), None)
+
+
+class GraphSuite:
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def close(self):
+        pass
+
+    def benchmarks(self):
+        for note_size, article in self.dataset.articles.items():
+            loaded = ArticleGraph.load(article)
+            note_ids = loaded.note_ids.tolist()
+            edges = list(Connection.objects.filter(article=article).values_list('left_note_id', 'right_note_id'))
+            positions = compute_layout(loaded)
+            positions[::100] = np.nan
+
+            def new_graph(note_ids=note_ids, edges=edges):
+                return ArticleGraph(note_ids, edges)
+
+            benchmarks = [
+                ('ArticleGraph load', lambda _, article=article: ArticleGraph.load(article), None),
+                ('ArticleGraph build', lambda _, new_graph=new_graph: new_graph(), None),
+                ('ArticleGraph degree_ranking', lambda graph: graph.degree_ranking(limit=20), new_graph),
+                ('ArticleGraph components', lambda graph: graph.components(), new_graph),
+                ('ArticleGraph orphans', lambda graph: graph.orphans(), new_graph),
+                ('ArticleGraph shortest_path', lambda graph, note_ids=note_ids: graph.shortest_path(
+                    note_ids[0], note_ids[-1],
+                ), new_graph),
+                ('radial_layout', lambda graph: radial_layout(graph), new_graph),
+                ('compute_layout', lambda graph: compute_layout(graph), new_graph),
+                ('incremental_layout', lambda graph, positions=positions: incremental_layout(graph, positions),
+                 new_graph),
+            ]
+
+            for name, run, setup in benchmarks:
+                yield Benchmark(f'{name} n={note_size}', run, setup)
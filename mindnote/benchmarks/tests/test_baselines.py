@@ -0,0 +1,27 @@
+from assertpy import assert_that
+from django.test import TestCase
+
+from benchmarks.baselines import compare
+from benchmarks.suites import Result
+
+
+class CompareTestCase(TestCase):
+    def test_should_mark_regressions_over_threshold(self):
+        baseline_results = {
+            'fast': {'median_ms': 10.0},
+            'slow': {'median_ms': 10.0},
+            'tiny': {'median_ms': 0.1},
+        }
+        current_results = {
+            'fast': Result(median_ms=11.0, p95_ms=11.0, min_ms=11.0, repeat=5),
+            'slow': Result(median_ms=13.0, p95_ms=13.0, min_ms=13.0, repeat=5),
+            'tiny': Result(median_ms=0.5, p95_ms=0.5, min_ms=0.5, repeat=5),
+            'new': Result(median_ms=1.0, p95_ms=1.0, min_ms=1.0, repeat=5),
+        }
+
+        comparisons = {comparison.name: comparison for comparison in compare(baseline_results, current_results)}
+
+        assert_that(comparisons).does_not_contain_key('new')
+        assert_that(comparisons['fast'].regressed).is_false()
+        assert_that(comparisons['slow'].regressed).is_true()
+        assert_that(comparisons['tiny'].regressed).is_false()
@@ -0,0 +1,23 @@
+from assertpy import assert_that
+from django.test import TestCase
+
+from articles.models import Note, Connection
+from benchmarks.datasets import DatasetGenerator
+
+
+class DatasetGeneratorTestCase(TestCase):
+    def test_should_generate_articles_with_connected_notes(self):
+        dataset = DatasetGenerator(seed=0).generate((10, 100))
+
+        assert_that(dataset.articles).contains_key(10, 100)
+        for note_size, article in dataset.articles.items():
+            article.refresh_from_db()
+            connection_count = Connection.objects.filter(article=article).count()
+
+            assert_that(Note.objects.filter(article=article).count()).is_equal_to(note_size)
+            assert_that(connection_count).is_between(note_size - 1, int(note_size * 1.1) - 1)
+            assert_that(article.note_count).is_equal_to(note_size)
+            assert_that(article.connection_count).is_equal_to(connection_count)
+
+    def test_should_generate_same_edges_with_same_seed(self):
+        assert_that(DatasetGenerator(seed=1).edges(1000)).is_equal_to(DatasetGenerator(seed=1).edges(1000))
@@ -0,0 +1,37 @@
+from io import StringIO
+from unittest import mock
+
+from assertpy import assert_that
+from django.core.management import call_command, CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from benchmarks.datasets import DatasetGenerator
+from users.models import User
+
+
+class RunBenchmarksTestCase(TestCase):
+    def test_should_run_with_confirmed_database(self):
+        output = StringIO()
+        with override_settings(DEBUG=False, TEST=False):
+            call_command('run_benchmarks', profile='small', suite=['graphs'], filter='ArticleGraph load',
+                         repeat=1, warmup=0, database=connection.settings_dict['NAME'], stdout=output)
+
+        assert_that(output.getvalue()).contains('ArticleGraph load n=1000')
+        assert_that(User.objects.exists()).is_false()
+
+    @override_settings(DEBUG=False, TEST=False)
+    def test_should_not_run_without_confirmed_database(self):
+        assert_that(call_command).raises(CommandError).when_called_with('run_benchmarks')
+        assert_that(call_command).raises(CommandError).when_called_with('run_benchmarks', database='production')
+        assert_that(call_command).raises(CommandError).when_called_with('benchmark_search')
+        assert_that(call_command).raises(CommandError).when_called_with('benchmark_asgi')
+        assert_that(User.objects.exists()).is_false()
+
+    def test_should_delete_partially_generated_dataset(self):
+        with mock.patch.object(DatasetGenerator, 'generate_graph', side_effect=RuntimeError):
+            assert_that(call_command).raises(RuntimeError).when_called_with(
+                'run_benchmarks', profile='small', stdout=StringIO(),
+            )
+
+        assert_that(User.objects.exists()).is_false()
@@ -0,0 +1,29 @@
+from assertpy import assert_that
+from django.test import TestCase
+
+from benchmarks.datasets import DatasetGenerator
+from benchmarks.suites import EndpointSuite, SerializerSuite, GraphSuite, SKIPPED_URL_NAMES, measure, \
+    get_router_url_names
+
+
+class SuiteTestCase(TestCase):
+    def setUp(self):
+        self.generator = DatasetGenerator(seed=0)
+        self.dataset = self.generator.generate((10,))
+
+    def test_endpoint_suite_should_cover_every_router_endpoint(self):
+        suite = EndpointSuite(self.dataset, self.generator)
+        for benchmark in suite.benchmarks():
+            measure(benchmark, repeat=1, warmup=0)
+        suite.close()
+
+        assert_that(suite.covered_url_names | set(SKIPPED_URL_NAMES)).is_equal_to(get_router_url_names())
+
+    def test_should_measure_serializer_and_graph_suites(self):
+        for suite in (SerializerSuite(self.dataset), GraphSuite(self.dataset)):
+            for benchmark in suite.benchmarks():
+                result = measure(benchmark, repeat=2, warmup=0)
+
+                assert_that(result.repeat).is_equal_to(2)
+                assert_that(result.min_ms).is_less_than_or_equal_to(result.median_ms)
+
@@ -1,5 +1,15 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
 
 
 class CommonsConfig(AppConfig):
     name = 'commons'
+
+    def ready(self):
+        from commons.db import check_persistent_connections
+        from commons.n_plus_one import install_n_plus_one_detector
+        from commons.timings import install_query_recorder
+        request_started.connect(check_persistent_connections)
+        connection_created.connect(install_query_recorder)
+        connection_created.connect(install_n_plus_one_detector)
@@ -0,0 +1,27 @@
+import functools
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+
+def as_async_view(view):
+    # Django 3.1 runs every sync view on one shared thread under ASGI, so this runs it on the thread pool instead.
+    # The pool thread has its own database connection, which is recycled here like request_started/finished do.
+    def run_view(request, *args, **kwargs):
+        close_old_connections()
+        try:
+            response = view(request, *args, **kwargs)
+
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+
+            return response
+
+        finally:
+            close_old_connections()
+
+    @functools.wraps(view)
+    async def async_view(request, *args, **kwargs):
+        return await sync_to_async(run_view, thread_sensitive=False)(request, *args, **kwargs)
+
+    return async_view
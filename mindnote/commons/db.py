@@ -0,0 +1,10 @@
+from django.db import connections
+
+
+def check_persistent_connections(**kwargs):
+    for connection in connections.all():
+        if not connection.settings_dict.get('CONN_HEALTH_CHECKS') or connection.connection is None:
+            continue
+
+        if not connection.is_usable():
+            connection.close()
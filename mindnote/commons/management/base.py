@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class BenchmarkCommand(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument('--database', help='name of the configured database the generated data may be written to, '
+                                               'required unless DEBUG or TEST is on')
+
+    def execute(self, *args, **options):
+        database = options.get('database')
+        if database is None and not (settings.DEBUG or settings.TEST):
+            raise CommandError('refusing to write generated data without DEBUG or TEST, pass --database to confirm '
+                               'the database')
+        if database is not None and database != connection.settings_dict['NAME']:
+            raise CommandError(f'--database {database} does not match the configured database')
+
+        return super().execute(*args, **options)
@@ -0,0 +1,83 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import Client, AsyncClient, override_settings
+from model_bakery import baker
+
+from articles.changes import delete_articles
+from articles.models import Article
+from commons.management.base import BenchmarkCommand
+
+
+class Command(BenchmarkCommand):
+    help = 'Compare WSGI and ASGI throughput of the hot read endpoints at a given concurrency'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--notes', type=int, default=100)
+
+    def handle(self, *args, **options):
+        user = baker.make('users.User')
+        try:
+            article = baker.make('articles.Article', user=user)
+            baker.make('articles.Note', article=article, _quantity=options['notes'])
+            token = user.get_token().key
+
+            paths = [f'/articles/{article.id}/', '/articles/my-list/', f'/notes/?article={article.id}']
+
+            self.stdout.write(f'{"server":<8}{"path":<28}{"req/s":>10}{"p50 (ms)":>12}{"p99 (ms)":>12}')
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                for path in paths:
+                    self._write_result('wsgi', path, self._run_wsgi(path, token, options))
+                    with override_settings(ROOT_URLCONF='mindnote.asgi_urls'):
+                        self._write_result('asgi', path, asyncio.run(self._run_asgi(path, token, options)))
+
+        finally:
+            delete_articles(Article.objects.filter(user=user).values_list('id', flat=True))
+            user.delete()
+
+    def _run_wsgi(self, path, token, options):
+        local = threading.local()
+
+        def send_request(_):
+            if not hasattr(local, 'client'):
+                local.client = Client()
+
+            started_at = time.perf_counter()
+            response = local.client.get(path, HTTP_AUTHORIZATION=f'Token {token}')
+            assert response.status_code == 200, response.status_code
+            return time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            latencies = list(executor.map(send_request, range(options['requests'])))
+
+        return time.perf_counter() - started_at, latencies
+
+    async def _run_asgi(self, path, token, options):
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(options['concurrency'])
+
+        async def send_request():
+            async with semaphore:
+                started_at = time.perf_counter()
+                response = await client.get(path, authorization=f'Token {token}')
+                assert response.status_code == 200, response.status_code
+                return time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        latencies = await asyncio.gather(*[send_request() for _ in range(options['requests'])])
+
+        return time.perf_counter() - started_at, latencies
+
+    def _write_result(self, server, path, result):
+        elapsed, latencies = result
+        quantiles = statistics.quantiles(latencies, n=100)
+
+        self.stdout.write(f'{server:<8}{path:<28}{len(latencies) / elapsed:>10.1f}'
+                          f'{quantiles[49] * 1000:>12.2f}{quantiles[98] * 1000:>12.2f}')
@@ -0,0 +1,50 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = 'Compare request-like query latency with a fresh connection per request and with a persistent connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--iterations', type=int, default=200)
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        iterations = options['iterations']
+
+        fresh_latencies = self._measure(connection, iterations, reconnect=True)
+        persistent_latencies = self._measure(connection, iterations, reconnect=False)
+
+        self.stdout.write(f'{"mode":<12}{"p50 (ms)":>12}{"p99 (ms)":>12}{"max (ms)":>12}')
+        for mode, latencies in (('fresh', fresh_latencies), ('persistent', persistent_latencies)):
+            p50, p99 = self._percentiles(latencies)
+            self.stdout.write(f'{mode:<12}{p50:>12.3f}{p99:>12.3f}{max(latencies):>12.3f}')
+
+    @staticmethod
+    def _measure(connection, iterations, reconnect):
+        latencies = []
+        connection.close()
+
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            latencies.append((time.perf_counter() - started_at) * 1000)
+
+            if reconnect:
+                connection.close()
+
+        connection.close()
+
+        return latencies
+
+    @staticmethod
+    def _percentiles(latencies):
+        quantiles = statistics.quantiles(latencies, n=100)
+
+        return quantiles[49], quantiles[98]
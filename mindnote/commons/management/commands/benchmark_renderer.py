@@ -0,0 +1,70 @@
+import timeit
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer
+
+from commons.renderers import CamelCaseJSONRenderer
+
+
+class Command(BaseCommand):
+    help = 'Compare camel case JSON renderers on a synthetic article retrieve payload'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--notes', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        payload = self._build_payload(options['notes'])
+        renderers = (
+            ('djangorestframework_camel_case', LibraryCamelCaseJSONRenderer()),
+            ('commons.renderers', CamelCaseJSONRenderer()),
+        )
+
+        if renderers[0][1].render(payload) != renderers[1][1].render(payload):
+            self.stderr.write('Rendered payloads are different')
+
+        self.stdout.write(f'{"renderer":<34}{"best (ms)":>12}{"size (KB)":>12}')
+        for name, renderer in renderers:
+            best = min(timeit.repeat(lambda: renderer.render(payload), number=1, repeat=options['repeat']))
+            size = len(renderer.render(payload)) / 1024
+
+            self.stdout.write(f'{name:<34}{best * 1000:>12.2f}{size:>12.1f}')
+
+    @staticmethod
+    def _build_payload(note_quantity):
+        timestamp = '2021-03-03T14:25:00.000000+09:00'
+        notes = [
+            OrderedDict((
+                ('id', note_id),
+                ('article', 1),
+                ('contents', f'note contents {note_id}'),
+                ('created_at', timestamp),
+                ('updated_at', timestamp),
+            ))
+            for note_id in range(note_quantity)
+        ]
+        connections = [
+            OrderedDict((
+                ('id', connection_id),
+                ('article', 1),
+                ('left_note', connection_id),
+                ('right_note', connection_id + 1),
+                ('reason', f'connection reason {connection_id}'),
+                ('created_at', timestamp),
+                ('updated_at', timestamp),
+            ))
+            for connection_id in range(note_quantity - 1)
+        ]
+
+        return OrderedDict((
+            ('id', 1),
+            ('user', 1),
+            ('subject', 'subject'),
+            ('description', 'description'),
+            ('body', 'body'),
+            ('notes', notes),
+            ('connections', connections),
+            ('created_at', timestamp),
+            ('updated_at', timestamp),
+        ))
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+from django.db import connections
+
+from commons.timings import endpoint_histograms, install_query_recorder, start_timings, stop_timings
+
+
+class SyncAndAsyncMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            # same marker as django's MiddlewareMixin, so the handler awaits this instance instead of wrapping the
+            # whole chain into the single thread used for sync code under ASGI
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        state = self.before_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            self.after_response(request, state)
+
+        return self.process_response(request, response, state)
+
+    async def __acall__(self, request):
+        state = self.before_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.after_response(request, state)
+
+        return self.process_response(request, response, state)
+
+    def before_response(self, request):
+        pass
+
+    def after_response(self, request, state):
+        pass
+
+    def process_response(self, request, response, state):
+        return response
+
+
+class ServerTimingMiddleware(SyncAndAsyncMiddleware):
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if self.is_async:
+            self.process_view = self.async_process_view
+
+    def before_response(self, request):
+        for connection in connections.all():
+            install_query_recorder(connection)
+
+        timings, token = start_timings()
+        request.timings = timings
+
+        return timings, token, time.perf_counter()
+
+    def after_response(self, request, state):
+        timings, token, started_at = state
+        stop_timings(token)
+        timings.add('total', time.perf_counter() - started_at)
+
+    def process_response(self, request, response, state):
+        timings, _, _ = state
+        response['Server-Timing'] = timings.server_timing_header()
+        endpoint_histograms.observe(timings.endpoint, timings)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.set_endpoint(request, view_func)
+
+    async def async_process_view(self, request, view_func, view_args, view_kwargs):
+        self.set_endpoint(request, view_func)
+
+    @staticmethod
+    def set_endpoint(request, view_func):
+        timings = request.timings
+        timings.endpoint = f'{request.method} {request.resolver_match.view_name}'
+
+        view_class = getattr(view_func, 'cls', None)
+        if view_class is not None:
+            action = getattr(view_func, 'actions', {}).get(request.method.lower())
+            timings.action = f'{view_class.__name__}.{action}' if action else view_class.__name__
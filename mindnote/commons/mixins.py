@@ -1,28 +1,59 @@
+from django.http import QueryDict
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from commons.serializers import get_sparse_fieldset
+from commons.timings import timing
+
 
 class CreateWithRequestUserMixin:
     def create(self, request, *args, **kwargs):
-        data = {
-            **request.data,
-            'user': request.user.id,
-        }
+        data = request.data
+        if isinstance(data, QueryDict):
+            data = data.copy()
+        data['user'] = request.user.id
+
         article_serializer = self.get_serializer(data=data)
         article_serializer.is_valid(raise_exception=True)
         article_serializer.save()
 
-        return Response(article_serializer.data, status=status.HTTP_201_CREATED)
+        with timing('serialize'):
+            data = article_serializer.data
+
+        return Response(data, status=status.HTTP_201_CREATED)
 
 
 class MyListMixin:
     @action(detail=False, methods=['get'], url_path='my-list')
     def my_list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
 
-        return Response(serializer.data)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            with timing('serialize'):
+                data = self.get_serializer(page, many=True).data
+            return self.get_paginated_response(data)
+
+        with timing('serialize'):
+            data = self.get_serializer(queryset, many=True).data
+
+        return Response(data)
 
     def my_list_queryset(self, queryset):
-        return queryset.filter(user=self.request.user.id)
\ No newline at end of file
+        return queryset.filter(user=self.request.user.id)
+
+
+class SparseFieldsetMixin:
+    sparse_fieldset_actions = ('list', 'my_list')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        sparse_fieldset = get_sparse_fieldset(self.request)
+        if self.action not in self.sparse_fieldset_actions or sparse_fieldset is None:
+            return queryset
+
+        serializer_fields = self.get_serializer_class().Meta.fields
+
+        return queryset.only(*[field for field in serializer_fields if field in sparse_fieldset])
@@ -0,0 +1,108 @@
+import contextvars
+import logging
+import random
+import re
+import sys
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.fields import Field
+from rest_framework.permissions import BasePermission
+
+from commons.middlewares import SyncAndAsyncMiddleware
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_LIST_PATTERN = re.compile(r'\((?:%s, )*%s\)(?:, \((?:%s, )*%s\))*')
+SELECT_PATTERN = re.compile(r'\s*SELECT\b', re.IGNORECASE)
+
+_current_detector = contextvars.ContextVar('current_n_plus_one_detector', default=None)
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+def get_query_shape(sql):
+    return PLACEHOLDER_LIST_PATTERN.sub('(...)', sql)
+
+
+def get_query_origin():
+    frame = sys._getframe(2)
+    while frame is not None:
+        owner = frame.f_locals.get('self')
+        if isinstance(owner, Field) and owner.parent is not None:
+            return f'{type(owner.parent).__name__}.{owner.field_name}'
+        if isinstance(owner, BasePermission):
+            return f'{type(owner).__name__}.{frame.f_code.co_name}'
+        frame = frame.f_back
+
+    return None
+
+
+class NPlusOneDetector:
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.shape_counts = Counter()
+        self.shape_origins = defaultdict(Counter)
+
+    def record(self, sql):
+        shape = get_query_shape(sql)
+        self.shape_counts[shape] += 1
+        self.shape_origins[shape][get_query_origin()] += 1
+
+    def get_violations(self):
+        return [
+            {
+                'sql': shape,
+                'count': count,
+                'origins': [origin for origin, _ in self.shape_origins[shape].most_common() if origin],
+            }
+            for shape, count in self.shape_counts.most_common()
+            if count >= self.threshold
+        ]
+
+
+def detect_n_plus_one(execute, sql, params, many, context):
+    detector = _current_detector.get()
+    # batched writes like bulk_update(batch_size=...) repeat the same statement on purpose
+    if detector is not None and not many and SELECT_PATTERN.match(sql):
+        detector.record(sql)
+
+    return execute(sql, params, many, context)
+
+
+def install_n_plus_one_detector(connection, **kwargs):
+    if detect_n_plus_one not in connection.execute_wrappers:
+        connection.execute_wrappers.append(detect_n_plus_one)
+
+
+class NPlusOneMiddleware(SyncAndAsyncMiddleware):
+    def before_response(self, request):
+        options = settings.N_PLUS_ONE
+        if not options['ENABLED'] or random.random() >= options['SAMPLE_RATE']:
+            return None
+
+        for connection in connections.all():
+            install_n_plus_one_detector(connection)
+
+        detector = NPlusOneDetector(options['THRESHOLD'])
+        return detector, _current_detector.set(detector)
+
+    def after_response(self, request, state):
+        if state is not None:
+            _current_detector.reset(state[1])
+
+    def process_response(self, request, response, state):
+        if state is None:
+            return response
+
+        violations = state[0].get_violations()
+        if violations:
+            message = f'N+1 queries in {request.method} {request.path}: {violations}'
+            if settings.N_PLUS_ONE['RAISE']:
+                raise NPlusOneError(message)
+            logger.warning(message)
+
+        return response
@@ -0,0 +1,16 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    ordering = ('created_at', 'id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Todo(maitracle): 클라이언트가 모두 페이지네이션을 지원하면 항상 페이지네이션한다.
+        if self.cursor_query_param not in request.query_params \
+                and self.page_size_query_param not in request.query_params:
+            return None
+
+        return super().paginate_queryset(queryset, request, view)
@@ -0,0 +1,38 @@
+import codecs
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore, underscoreize
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+@lru_cache(maxsize=4096)
+def underscoreize_key(key, no_underscore_before_number=False):
+    return camel_to_underscore(key, no_underscore_before_number=no_underscore_before_number)
+
+
+class CamelCaseJSONParser(JSONParser):
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            decoded_stream = codecs.getreader(encoding)(stream)
+
+            if self.json_underscoreize.get('ignore_fields'):
+                return underscoreize(json.load(decoded_stream), **self.json_underscoreize)
+
+            return json.load(decoded_stream, object_pairs_hook=self._underscoreize_object)
+
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+    def _underscoreize_object(self, pairs):
+        no_underscore_before_number = self.json_underscoreize.get('no_underscore_before_number', False)
+
+        return {underscoreize_key(key, no_underscore_before_number): value for key, value in pairs}
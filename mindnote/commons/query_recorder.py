@@ -0,0 +1,99 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+import traceback
+from collections import deque
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+IGNORED_STACK_FILES = ('commons/query_recorder.py', 'commons/timings.py', 'commons/middlewares.py')
+
+
+def get_project_stack(limit=3):
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir) and not frame.filename.endswith(IGNORED_STACK_FILES)
+    ]
+
+    return [
+        f'{frame.filename[len(base_dir) + 1:]}:{frame.lineno} in {frame.name}'
+        for frame in frames[-limit:]
+    ]
+
+
+class QueryRecorder:
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if QueryRecorder._instance is None:
+            QueryRecorder._instance = QueryRecorder(settings.QUERY_RECORDER)
+
+        return QueryRecorder._instance
+
+    @classmethod
+    def reset(cls):
+        QueryRecorder._instance = None
+
+    def __init__(self, options):
+        self.slowest_size = options['SLOWEST_SIZE']
+        self.sample_size = options['SAMPLE_SIZE']
+        self.sample_rate = options['SAMPLE_RATE']
+        self.max_sql_length = options['MAX_SQL_LENGTH']
+
+        self._slowest = {}
+        self._sampled = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, action, sql, duration, many=False):
+        sampled = random.random() < self.sample_rate
+
+        with self._lock:
+            slowest = self._slowest.setdefault(endpoint, [])
+            is_slow = len(slowest) < self.slowest_size or (slowest and duration > slowest[0][0])
+            if not is_slow and not sampled:
+                return
+
+        entry = {
+            'sql': sql[:self.max_sql_length],
+            'duration': round(duration * 1000, 3),
+            'many': many,
+            'action': action,
+            'stack': get_project_stack(),
+            'recorded_at': time.time(),
+        }
+
+        with self._lock:
+            if is_slow:
+                heapq.heappush(slowest, (duration, next(self._sequence), entry))
+                if len(slowest) > self.slowest_size:
+                    heapq.heappop(slowest)
+            if sampled:
+                self._sampled.setdefault(endpoint, deque(maxlen=self.sample_size)).append(entry)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                endpoint: {
+                    'slowest': [entry for _, _, entry in sorted(slowest, reverse=True)],
+                    'sampled': list(self._sampled.get(endpoint, ())),
+                }
+                for endpoint, slowest in sorted(self._slowest.items())
+            }
+
+    def clear(self):
+        with self._lock:
+            self._slowest.clear()
+            self._sampled.clear()
+
+
+@receiver(setting_changed)
+def reset_query_recorder(setting, **kwargs):
+    if setting == 'QUERY_RECORDER':
+        QueryRecorder.reset()
@@ -0,0 +1,61 @@
+import re
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize_re, underscore_to_camel
+from rest_framework.renderers import JSONRenderer
+
+from commons.timings import timing
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=4096)
+def camelize_key(key):
+    if '_' not in key:
+        return key
+
+    return re.sub(camelize_re, underscore_to_camel, key)
+
+
+def camelize(data, ignore_fields=()):
+    if isinstance(data, SCALAR_TYPES):
+        return data
+
+    if isinstance(data, dict):
+        camelized_data = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+
+            camelized_key = camelize_key(key) if isinstance(key, str) else key
+            if key in ignore_fields or camelized_key in ignore_fields:
+                camelized_data[camelized_key] = value
+            else:
+                camelized_data[camelized_key] = camelize(value, ignore_fields)
+
+        return camelized_data
+
+    if isinstance(data, (list, tuple)):
+        return [camelize(item, ignore_fields) for item in data]
+
+    if isinstance(data, Promise):
+        return force_str(data)
+
+    try:
+        iterator = iter(data)
+    except TypeError:
+        return data
+
+    return [camelize(item, ignore_fields) for item in iterator]
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    def render(self, data, *args, **kwargs):
+        ignore_fields = api_settings.JSON_UNDERSCOREIZE.get('ignore_fields') or ()
+
+        with timing('render'):
+            return super().render(camelize(data, ignore_fields), *args, **kwargs)
+
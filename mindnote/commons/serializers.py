@@ -0,0 +1,27 @@
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework.permissions import SAFE_METHODS
+
+SPARSE_FIELDSET_QUERY_PARAM = 'fields'
+
+
+def get_sparse_fieldset(request):
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+
+    fields = request.query_params.get(SPARSE_FIELDSET_QUERY_PARAM)
+    if not fields:
+        return None
+
+    return {camel_to_underscore(field.strip()) for field in fields.split(',')}
+
+
+class SparseFieldsetSerializerMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        sparse_fieldset = get_sparse_fieldset(self.context.get('request'))
+        if sparse_fieldset is None:
+            return
+
+        for field_name in set(self.fields) - sparse_fieldset:
+            self.fields.pop(field_name)
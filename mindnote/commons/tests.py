@@ -1,3 +1,295 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import time
+from unittest import TestCase, mock
 
-# Create your tests here.
+from assertpy import assert_that
+from model_bakery import baker
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase, APIRequestFactory
+from django.http import HttpResponse
+from django.test import override_settings, SimpleTestCase, AsyncClient
+from django.urls import path
+from django.utils.translation import gettext_lazy
+from djangorestframework_camel_case.parser import CamelCaseJSONParser as LibraryCamelCaseJSONParser
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer
+from rest_framework.exceptions import ParseError
+
+from articles.models import Note
+from commons.async_views import as_async_view
+from commons.caches import LRUCache
+from commons.db import check_persistent_connections
+from commons.parsers import CamelCaseJSONParser
+from commons.renderers import CamelCaseJSONRenderer
+from commons.n_plus_one import NPlusOneError, NPlusOneMiddleware, get_query_shape
+from commons.query_recorder import QueryRecorder
+from commons.timings import Histogram, endpoint_histograms
+
+
+
+def sleeping_view(request):
+    time.sleep(0.3)
+    return HttpResponse()
+
+
+urlpatterns = [
+    path('sleep/', as_async_view(sleeping_view), name='sleep'),
+]
+
+
+class LRUCacheTestCase(TestCase):
+    def test_should_evict_least_recently_used(self):
+        cache = LRUCache(max_size=2, timeout=60)
+        cache.set('first', 1)
+        cache.set('second', 2)
+        cache.get('first')
+
+        cache.set('third', 3)
+
+        assert_that(cache.get('first')).is_equal_to(1)
+        assert_that(cache.get('second')).is_none()
+        assert_that(cache.get('third')).is_equal_to(3)
+        assert_that(cache.evictions).is_equal_to(1)
+
+    def test_should_expire_after_timeout(self):
+        cache = LRUCache(max_size=2, timeout=60)
+
+        with mock.patch('commons.caches.time.monotonic', return_value=100):
+            cache.set('key', 'value')
+        with mock.patch('commons.caches.time.monotonic', return_value=159):
+            assert_that(cache.get('key')).is_equal_to('value')
+        with mock.patch('commons.caches.time.monotonic', return_value=160):
+            assert_that(cache.get('key')).is_none()
+
+        assert_that(cache.hits).is_equal_to(1)
+        assert_that(cache.misses).is_equal_to(1)
+
+
+class CheckPersistentConnectionsTestCase(TestCase):
+    def test_should_close_unusable_connection_when_health_checks_are_enabled(self):
+        connection = mock.Mock(settings_dict={'CONN_HEALTH_CHECKS': True})
+        connection.is_usable.return_value = False
+
+        with mock.patch('commons.db.connections.all', return_value=[connection]):
+            check_persistent_connections()
+
+        connection.close.assert_called_once()
+
+    def test_should_keep_usable_connection(self):
+        connection = mock.Mock(settings_dict={'CONN_HEALTH_CHECKS': True})
+        connection.is_usable.return_value = True
+
+        with mock.patch('commons.db.connections.all', return_value=[connection]):
+            check_persistent_connections()
+
+        connection.close.assert_not_called()
+
+    def test_should_not_check_when_health_checks_are_disabled(self):
+        connection = mock.Mock(settings_dict={'CONN_HEALTH_CHECKS': False})
+
+        with mock.patch('commons.db.connections.all', return_value=[connection]):
+            check_persistent_connections()
+
+        connection.is_usable.assert_not_called()
+
+
+class CamelCaseJSONRendererTestCase(TestCase):
+    def test_should_render_same_as_library_renderer(self):
+        data = {
+            'id': 1,
+            'created_at': '2021-03-03T14:25:00+09:00',
+            'notes': [
+                {'left_note': 1, 'note_2_id': 2, 'reason': gettext_lazy('lazy reason')},
+            ],
+            'connection_pairs': [(0, 1), (1, 2)],
+            'nested_set': {'inner_key': None},
+            'noUnderscore': True,
+        }
+
+        rendered = CamelCaseJSONRenderer().render(data)
+
+        assert_that(rendered).is_equal_to(LibraryCamelCaseJSONRenderer().render(data))
+
+
+class CamelCaseJSONParserTestCase(TestCase):
+    def test_should_parse_same_as_library_parser(self):
+        body = json.dumps({
+            'leftNote': 1,
+            'notes': {
+                'create': [{'contents': '한글 contents', 'positionX': 1.5}],
+                'delete': [1, 2],
+            },
+            'note2Id': 2,
+            'HTTPResponse': None,
+        }).encode()
+
+        parsed = CamelCaseJSONParser().parse(io.BytesIO(body))
+
+        assert_that(parsed).is_equal_to(LibraryCamelCaseJSONParser().parse(io.BytesIO(body)))
+        assert_that(parsed['left_note']).is_equal_to(1)
+
+    def test_should_raise_parse_error(self):
+        with self.assertRaises(ParseError):
+            CamelCaseJSONParser().parse(io.BytesIO(b'{"leftNote": '))
+
+
+class HistogramTestCase(TestCase):
+    def test_should_estimate_quantiles_by_bucket_upper_bounds(self):
+        histogram = Histogram()
+        for value in (0.5, 3, 3, 40, 7000):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert_that(snapshot['count']).is_equal_to(5)
+        assert_that(snapshot['p50']).is_equal_to(5)
+        assert_that(snapshot['p99']).is_none()
+        assert_that(snapshot['buckets']).contains_entry({'1': 1}, {'5': 2}, {'50': 1}, {'inf': 1})
+
+
+class ServerTimingMiddlewareTestCase(APITestCase):
+    def setUp(self):
+        endpoint_histograms.clear()
+
+    def test_should_emit_server_timing_header(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/articles/{article.id}/')
+
+        assert_that(response['Server-Timing']).matches(r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="4 queries", '
+                                                      r'serialize;dur=[\d.]+, render;dur=[\d.]+$')
+
+    def test_should_aggregate_endpoint_histograms(self):
+        user = baker.make('users.User')
+        admin = baker.make('users.User', is_staff=True)
+
+        self.client.force_authenticate(user=user)
+        for _ in range(3):
+            self.client.get('/articles/my-list/')
+
+        self.client.force_authenticate(user=admin)
+        response = self.client.get('/stats/endpoints/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(response.data['GET article-my-list']['total']['count']).is_equal_to(3)
+        assert_that(response.data['GET article-my-list']['queries']['p50']).is_equal_to(1)
+
+    def test_should_not_get_endpoint_stats_forbidden(self):
+        user = baker.make('users.User')
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get('/stats/endpoints/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
+
+
+class QueryRecorderTestCase(APITestCase):
+    def setUp(self):
+        QueryRecorder.reset()
+
+    @override_settings(QUERY_RECORDER={
+        'SLOWEST_SIZE': 2,
+        'SAMPLE_SIZE': 10,
+        'SAMPLE_RATE': 0,
+        'MAX_SQL_LENGTH': 2000,
+    })
+    def test_should_keep_slowest_queries_with_viewset_action(self):
+        user = baker.make('users.User')
+        admin = baker.make('users.User', is_staff=True)
+        article = baker.make('articles.Article', user=user)
+
+        self.client.force_authenticate(user=user)
+        self.client.get(f'/articles/{article.id}/')
+
+        self.client.force_authenticate(user=admin)
+        response = self.client.get('/stats/queries/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+        slowest = response.data['GET article-detail']['slowest']
+        assert_that(slowest).is_length(2)
+        assert_that(slowest[0]['duration']).is_greater_than_or_equal_to(slowest[1]['duration'])
+        assert_that(slowest[0]['action']).is_equal_to('ArticleViewSet.retrieve')
+        assert_that(slowest[0]['stack'][-1]).starts_with('articles/')
+        assert_that(response.data['GET article-detail']['sampled']).is_empty()
+
+    def test_should_sample_queries_into_bounded_buffer(self):
+        recorder = QueryRecorder({'SLOWEST_SIZE': 0, 'SAMPLE_SIZE': 2, 'SAMPLE_RATE': 1, 'MAX_SQL_LENGTH': 6})
+        for index in range(3):
+            recorder.record('GET endpoint', None, f'SELECT {index}', 0.001)
+
+        sampled = recorder.snapshot()['GET endpoint']['sampled']
+
+        assert_that([entry['sql'] for entry in sampled]).is_equal_to(['SELECT', 'SELECT'])
+        assert_that(sampled).is_length(2)
+
+
+class NoteWithArticleSubjectSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    article_subject = serializers.CharField(source='article.subject')
+
+
+class NPlusOneMiddlewareTestCase(APITestCase):
+    def _serialize_notes(self, request):
+        return NoteWithArticleSubjectSerializer(Note.objects.all(), many=True).data
+
+    def test_should_collapse_placeholder_lists(self):
+        assert_that(get_query_shape('SELECT 1 FROM note WHERE id IN (%s, %s, %s)')) \
+            .is_equal_to('SELECT 1 FROM note WHERE id IN (...)')
+
+    def test_should_raise_with_responsible_serializer_field(self):
+        baker.make('articles.Note', _quantity=5)
+        middleware = NPlusOneMiddleware(self._serialize_notes)
+
+        with self.assertRaises(NPlusOneError) as context:
+            middleware(APIRequestFactory().get('/notes/'))
+
+        assert_that(str(context.exception)).contains('NoteWithArticleSubjectSerializer.article_subject')
+
+    @override_settings(N_PLUS_ONE={'ENABLED': True, 'THRESHOLD': 5, 'SAMPLE_RATE': 1.0, 'RAISE': False})
+    def test_should_log_warning_when_not_raising(self):
+        baker.make('articles.Note', _quantity=5)
+        middleware = NPlusOneMiddleware(self._serialize_notes)
+
+        with self.assertLogs('commons.n_plus_one', level='WARNING'):
+            middleware(APIRequestFactory().get('/notes/'))
+
+    def test_should_not_count_batched_writes(self):
+        notes = baker.make('articles.Note', _quantity=10)
+
+        def update_notes(request):
+            for note in notes:
+                Note.objects.filter(id=note.id).update(contents='changed contents')
+            return notes
+
+        middleware = NPlusOneMiddleware(update_notes)
+
+        assert_that(middleware(APIRequestFactory().patch('/notes/'))).is_length(10)
+
+    def test_should_pass_below_threshold(self):
+        baker.make('articles.Note', _quantity=4)
+        middleware = NPlusOneMiddleware(self._serialize_notes)
+
+        assert_that(middleware(APIRequestFactory().get('/notes/'))).is_length(4)
+
+
+@override_settings(ROOT_URLCONF='commons.tests')
+class AsyncMiddlewareTestCase(SimpleTestCase):
+    def test_should_serve_async_views_concurrently(self):
+        endpoint_histograms.clear()
+
+        async def get_concurrently():
+            client = AsyncClient()
+            return await asyncio.gather(*[client.get('/sleep/') for _ in range(5)])
+
+        started_at = time.perf_counter()
+        responses = asyncio.run(get_concurrently())
+        elapsed = time.perf_counter() - started_at
+
+        for response in responses:
+            assert_that(response.status_code).is_equal_to(status.HTTP_200_OK)
+            assert_that(response['Server-Timing']).starts_with('total;dur=')
+        assert_that(elapsed).is_less_than(0.3 * 3)
+        assert_that(endpoint_histograms.snapshot()['GET sleep']['total']['count']).is_equal_to(5)
@@ -0,0 +1,137 @@
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from commons.query_recorder import QueryRecorder
+
+HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+TIMING_NAMES = ('total', 'db', 'serialize', 'render')
+
+_current_timings = contextvars.ContextVar('current_timings', default=None)
+
+
+class RequestTimings:
+    def __init__(self):
+        self.endpoint = 'unresolved'
+        self.action = None
+        self.query_count = 0
+        self.durations = dict.fromkeys(TIMING_NAMES, 0.0)
+
+    def add(self, name, duration):
+        self.durations[name] += duration
+
+    def server_timing_header(self):
+        descriptions = {'db': f'{self.query_count} queries'}
+
+        return ', '.join(
+            f'{name};dur={duration * 1000:.1f}'
+            + (f';desc="{descriptions[name]}"' if name in descriptions else '')
+            for name, duration in self.durations.items()
+        )
+
+
+def start_timings():
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def stop_timings(token):
+    _current_timings.reset(token)
+
+
+@contextmanager
+def timing(name):
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started_at)
+
+
+def record_query(execute, sql, params, many, context):
+    timings = _current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started_at
+        timings.query_count += 1
+        timings.add('db', duration)
+        QueryRecorder.instance().record(timings.endpoint, timings.action, sql, duration, many)
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, quantile):
+        rank = quantile * self.count
+        seen = 0
+        for upper_bound, count in zip(HISTOGRAM_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return upper_bound
+
+        return None
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip([*map(str, HISTOGRAM_BUCKETS), 'inf'], self.counts)),
+        }
+
+
+class EndpointHistograms:
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint, timings):
+        with self._lock:
+            histograms = self._histograms.get(endpoint)
+            if histograms is None:
+                histograms = self._histograms[endpoint] = {name: Histogram() for name in (*TIMING_NAMES, 'queries')}
+
+            for name, duration in timings.durations.items():
+                histograms[name].observe(duration * 1000)
+            histograms['queries'].observe(timings.query_count)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                endpoint: {name: histogram.snapshot() for name, histogram in histograms.items()}
+                for endpoint, histograms in sorted(self._histograms.items())
+            }
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+endpoint_histograms = EndpointHistograms()
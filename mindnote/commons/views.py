@@ -1,3 +1,31 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from commons.query_recorder import QueryRecorder
+from commons.timings import endpoint_histograms
+
+
+class EndpointStatsView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, *args, **kwargs):
+        return Response(endpoint_histograms.snapshot())
+
+    def delete(self, request, *args, **kwargs):
+        endpoint_histograms.clear()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class QueryStatsView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, *args, **kwargs):
+        return Response(QueryRecorder.instance().snapshot())
+
+    def delete(self, request, *args, **kwargs):
+        QueryRecorder.instance().clear()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,25 @@
+"""mindnote URL Configuration for ASGI
+
+Same routes as mindnote.urls, but the hot read endpoints are served by async views, so concurrent requests run in
+parallel instead of queueing on the single thread Django uses for sync views under ASGI.
+"""
+from django.urls import URLPattern
+
+from commons.async_views import as_async_view
+from mindnote.urls import urlpatterns as wsgi_urlpatterns
+
+ASYNC_URL_NAMES = (
+    'article-detail',
+    'article-my-list',
+    'note-list',
+)
+
+
+def _as_async_pattern(pattern):
+    if not isinstance(pattern, URLPattern) or pattern.name not in ASYNC_URL_NAMES:
+        return pattern
+
+    return URLPattern(pattern.pattern, as_async_view(pattern.callback), pattern.default_args, pattern.name)
+
+
+urlpatterns = [_as_async_pattern(pattern) for pattern in wsgi_urlpatterns]
@@ -44,6 +44,8 @@ INSTALLED_APPS = DJANGO_APPS + PACKAGE_APPS + PROJECT_APPS
 
 
 MIDDLEWARE = [
+    'commons.middlewares.ServerTimingMiddleware',
+    'commons.n_plus_one.NPlusOneMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -54,7 +56,7 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
 ]
 
-ROOT_URLCONF = 'mindnote.urls'
+ROOT_URLCONF = os.environ.get('DJANGO_ROOT_URLCONF', 'mindnote.urls')
 
 TEMPLATES = [
     {
@@ -87,6 +89,10 @@ DATABASES = {
         'PASSWORD': os.environ['DEFAULT_DATABASE_PASSWORD'],
         'HOST': os.environ['DEFAULT_DATABASE_HOST'],
         'PORT': os.environ['DEFAULT_DATABASE_PORT'],
+        # seconds to keep a connection open between requests, 0 closes it at the end of every request
+        'CONN_MAX_AGE': int(os.environ.get('DEFAULT_DATABASE_CONN_MAX_AGE', 0)),
+        # ping reused persistent connections when a request starts and reconnect if they are broken
+        'CONN_HEALTH_CHECKS': False,
     }
 }
 
@@ -135,18 +141,85 @@ STATIC_URL = '/static/'
 # django rest framework settings
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
+        'commons.renderers.CamelCaseJSONRenderer',
         'djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
         'djangorestframework_camel_case.parser.CamelCaseFormParser',
         'djangorestframework_camel_case.parser.CamelCaseMultiPartParser',
-        'djangorestframework_camel_case.parser.CamelCaseJSONParser',
+        'commons.parsers.CamelCaseJSONParser',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication',
     ],
 }
 
+# token authentication cache
+# BACKEND is 'local' for a per process LRU or 'django' for the CACHES entry named by CACHE_ALIAS
+# deleted tokens and deactivated users are only invalidated in the cache of the process which changed them, so
+# 'local' is for single process servers and deployments with several workers need 'django' with a shared CACHES entry,
+# which `manage.py check --deploy` warns about
+TOKEN_AUTHENTICATION_CACHE = {
+    'BACKEND': os.environ.get('TOKEN_AUTHENTICATION_CACHE_BACKEND', 'local'),
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60,
+    'MAX_SIZE': 10000,
+}
+
+# article retrieve cache
+# BACKEND is 'local' for a per process LRU, 'file' for a file based cache in LOCATION
+# or 'django' for the CACHES entry named by CACHE_ALIAS
+ARTICLE_CACHE = {
+    'BACKEND': os.environ.get('ARTICLE_CACHE_BACKEND', 'local'),
+    'CACHE_ALIAS': 'default',
+    'LOCATION': os.environ.get('ARTICLE_CACHE_LOCATION', '/tmp/mindnote-article-cache'),
+    'TIMEOUT': 300,
+    'MAX_SIZE': 1000,
+}
+
+# article graph analytics cache
+ARTICLE_GRAPH_CACHE = {
+    'TIMEOUT': 300,
+    'MAX_SIZE': 1000,
+}
+
+# per user inverted indexes of the search fallback used when the database is not postgresql
+ARTICLE_SEARCH_INDEX_CACHE = {
+    'TIMEOUT': 300,
+    'MAX_SIZE': 100,
+}
+
+# deleted note and connection ids kept in seconds for article changes, older since values need a full resync
+# tombstones past RETENTION are removed by `manage.py purge_tombstones`
+ARTICLE_CHANGES = {
+    'RETENTION': 60 * 60 * 24 * 30,
+}
+
+# bounded per endpoint query capture, used instead of DEBUG's connection.queries
+QUERY_RECORDER = {
+    'SLOWEST_SIZE': 20,
+    'SAMPLE_SIZE': 100,
+    'SAMPLE_RATE': float(os.environ.get('QUERY_RECORDER_SAMPLE_RATE', 0.01)),
+    'MAX_SQL_LENGTH': 2000,
+}
+
+# repeated same shape queries in a request, RAISE fails the request instead of logging a warning
+N_PLUS_ONE = {
+    'ENABLED': False,
+    'THRESHOLD': 5,
+    'SAMPLE_RATE': 1.0,
+    'RAISE': False,
+}
+
 # for request
 DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.2
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+
+# verified google accounts by hashed o auth token
+GOOGLE_ACCOUNT_INFO_CACHE = {
+    'TIMEOUT': 300,
+    'MAX_SIZE': 10000,
+}
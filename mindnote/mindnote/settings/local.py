@@ -5,5 +5,7 @@ PROFILE = 'Local'
 
 DEBUG = True
 
+INSTALLED_APPS = INSTALLED_APPS + ['benchmarks']
+
 CORS_ORIGIN_ALLOW_ALL = True
 CORS_ALLOW_CREDENTIALS = True
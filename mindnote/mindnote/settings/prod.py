@@ -3,7 +3,7 @@ from mindnote.settings.base import *
 
 PROFILE = 'Production'
 
-DEBUG = True
+DEBUG = False
 
 CORS_ORIGIN_ALLOW_ALL = True
 CORS_ALLOW_CREDENTIALS = True
@@ -13,3 +13,17 @@ ALLOWED_HOSTS = ['*']
 SESSION_COOKIE_SECURE = True
 SESSION_COOKIE_HTTPONLY = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTOCOL', 'https')
+
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DEFAULT_DATABASE_CONN_MAX_AGE', 60))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+TOKEN_AUTHENTICATION_CACHE = {
+    **TOKEN_AUTHENTICATION_CACHE,
+    'BACKEND': os.environ.get('TOKEN_AUTHENTICATION_CACHE_BACKEND', 'django'),
+}
+
+N_PLUS_ONE = {
+    **N_PLUS_ONE,
+    'ENABLED': True,
+    'SAMPLE_RATE': float(os.environ.get('N_PLUS_ONE_SAMPLE_RATE', 0.01)),
+}
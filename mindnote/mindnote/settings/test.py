@@ -6,3 +6,11 @@ PROFILE = 'Test'
 DEBUG = True
 
 TEST = True
+
+INSTALLED_APPS = INSTALLED_APPS + ['benchmarks']
+
+N_PLUS_ONE = {
+    **N_PLUS_ONE,
+    'ENABLED': True,
+    'RAISE': True,
+}
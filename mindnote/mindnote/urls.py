@@ -18,6 +18,7 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from articles.views import ArticleViewSet, NoteViewSet, ConnectionViewSet
+from commons.views import EndpointStatsView, QueryStatsView
 from users.views import UserViewSet
 
 
@@ -29,6 +30,8 @@ router.register('connections', ConnectionViewSet)
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('stats/endpoints/', EndpointStatsView.as_view(), name='endpoint-stats'),
+    path('stats/queries/', QueryStatsView.as_view(), name='query-stats'),
 ]
 
 urlpatterns += router.urls
@@ -1,7 +1,11 @@
+import hashlib
+import threading
 from abc import ABC
+from concurrent.futures import Future
 
 from rest_framework.exceptions import ValidationError
 
+from commons.caches import LRUCache
 from services.exceptions import ExternalRequestTimeoutOrUnreachable
 from services.requests import Request
 from users.models import User
@@ -33,11 +37,78 @@ class GoogleClient(ABC):
         return user, is_created
 
 
+class GoogleAccountInfoCache:
+    def __init__(self, max_size, timeout):
+        self.cache = LRUCache(max_size=max_size, timeout=timeout)
+        self.coalesced = 0
+
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, o_auth, fetch):
+        key = hashlib.sha256(o_auth.encode()).hexdigest()
+
+        account_info = self.cache.get(key)
+        if account_info is not None:
+            return account_info
+
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if in_flight is not None:
+            return in_flight.result()
+
+        in_flight = self._in_flight[key]
+        try:
+            account_info = fetch(o_auth)
+            self.cache.set(key, account_info)
+            in_flight.set_result(account_info)
+
+            return account_info
+
+        except Exception as e:
+            in_flight.set_exception(e)
+            raise
+
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def metrics(self):
+        lookups = self.cache.hits + self.cache.misses
+
+        return {
+            'hits': self.cache.hits,
+            'misses': self.cache.misses,
+            'coalesced': self.coalesced,
+            'hit_rate': self.cache.hits / lookups if lookups else 0,
+        }
+
+
 class GoogleClientWithRequest(GoogleClient):
     GOOGLE_GET_EMAIL_URL = 'https://www.googleapis.com/oauth2/v2/userinfo'
 
+    _account_info_cache = None
+
+    @classmethod
+    def account_info_cache(cls):
+        if GoogleClientWithRequest._account_info_cache is None:
+            options = settings.GOOGLE_ACCOUNT_INFO_CACHE
+            GoogleClientWithRequest._account_info_cache = GoogleAccountInfoCache(max_size=options['MAX_SIZE'],
+                                                                                 timeout=options['TIMEOUT'])
+
+        return GoogleClientWithRequest._account_info_cache
+
     @classmethod
     def _get_google_account_info(cls, o_auth):
+        return cls.account_info_cache().get_or_fetch(o_auth, cls._request_google_account_info)
+
+    @classmethod
+    def _request_google_account_info(cls, o_auth):
         request = Request.instance()
 
         try:
@@ -1,13 +1,22 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 from services.exceptions import ExternalRequestServerError, ExternalRequestClientError, \
     ExternalRequestTimeoutOrUnreachable
 
+RETRYABLE_EXCEPTIONS = (ExternalRequestServerError, ExternalRequestTimeoutOrUnreachable)
+
 
 class Request(ABC):
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
     @classmethod
     def instance(cls):
         if settings.TEST:
@@ -25,14 +34,58 @@ class Request(ABC):
     def request(self, method, url, data=None, json=None, timeout=None, auth=None, **options):
         pass
 
+    @classmethod
+    def get_retries(cls, method, retries=None):
+        if retries is not None:
+            return retries
+
+        # non idempotent requests could be applied twice, so they are not retried unless asked
+        return settings.DEFAULT_RETRIES if method.upper() in cls.IDEMPOTENT_METHODS else 0
+
+    @staticmethod
+    def get_backoff(attempt):
+        return settings.DEFAULT_RETRY_BACKOFF * (2 ** attempt)
+
 
 class RequestWithHttp(Request):
-    def request(self, method, url, data=None, json=None, timeout=None, auth=None, **options):
+    _session = None
+
+    @classmethod
+    def get_session(cls):
+        if RequestWithHttp._session is None:
+            adapter = HTTPAdapter(pool_connections=settings.HTTP_POOL_CONNECTIONS,
+                                  pool_maxsize=settings.HTTP_POOL_MAXSIZE)
+
+            session = requests.Session()
+            # the session is shared by every user's requests, so upstream cookies must not be kept between them
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            RequestWithHttp._session = session
+
+        return RequestWithHttp._session
+
+    def request(self, method, url, data=None, json=None, timeout=None, auth=None, retries=None, **options):
+        retries = self.get_retries(method, retries)
+
+        for attempt in range(retries + 1):
+            try:
+                return self.request_once(method, url, data=data, json=json, timeout=timeout, auth=auth, **options)
+
+            except RETRYABLE_EXCEPTIONS:
+                if attempt == retries:
+                    raise
+
+                time.sleep(self.get_backoff(attempt))
+
+    def request_once(self, method, url, data=None, json=None, timeout=None, auth=None, **options):
         timeout = timeout or settings.DEFAULT_TIMEOUT
 
         response = None
         try:
-            response = requests.request(method, url, data=data, json=json, timeout=timeout, auth=auth, **options)
+            response = self.get_session().request(method, url, data=data, json=json, timeout=timeout, auth=auth,
+                                                  **options)
 
             response.raise_for_status()
 
@@ -54,3 +107,36 @@ class RequestWithHttp(Request):
 class RequestWithTest(Request):
     def request(self, method, url, data=None, json=None, timeout=None, auth=None, **options):
         raise Exception('Mocking needed')
+
+
+class AsyncRequest(Request, ABC):
+    @classmethod
+    def instance(cls):
+        if settings.TEST:
+            return AsyncRequestWithTest()
+
+        return AsyncRequestWithHttp()
+
+
+class AsyncRequestWithHttp(AsyncRequest):
+    def __init__(self):
+        self.request_with_http = RequestWithHttp()
+
+    async def request(self, method, url, data=None, json=None, timeout=None, auth=None, retries=None, **options):
+        retries = self.get_retries(method, retries)
+        request_once = sync_to_async(self.request_with_http.request_once, thread_sensitive=False)
+
+        for attempt in range(retries + 1):
+            try:
+                return await request_once(method, url, data=data, json=json, timeout=timeout, auth=auth, **options)
+
+            except RETRYABLE_EXCEPTIONS:
+                if attempt == retries:
+                    raise
+
+                await asyncio.sleep(self.get_backoff(attempt))
+
+
+class AsyncRequestWithTest(AsyncRequest):
+    async def request(self, method, url, data=None, json=None, timeout=None, auth=None, **options):
+        raise Exception('Mocking needed')
@@ -0,0 +1,66 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer:
+    def __init__(self, responses, delay=0, headers=None):
+        self.responses = list(responses)
+        self.delay = delay
+        self.headers = headers or {}
+        self.requests = []
+        self.request_headers = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._build_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def _next_response(self, handler):
+        with self._lock:
+            self.requests.append((handler.command, handler.path))
+            self.request_headers.append(handler.headers)
+            if len(self.responses) > 1:
+                return self.responses.pop(0)
+            return self.responses[0]
+
+    def _build_handler(self):
+        stub_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self._respond()
+
+            def _respond(self):
+                status_code, body = stub_server._next_response(self)
+                time.sleep(stub_server.delay)
+                encoded_body = json.dumps(body).encode()
+
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(encoded_body)))
+                for name, value in stub_server.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(encoded_body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
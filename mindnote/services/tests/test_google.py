@@ -0,0 +1,69 @@
+import threading
+from unittest import mock
+
+from assertpy import assert_that
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import ValidationError
+
+from services.google import GoogleClientWithRequest
+from services.tests.stub_server import StubServer
+
+google_account_info = {
+    'email': 'google_user@google.com',
+    'name': 'google user',
+}
+
+
+@override_settings(TEST=False, DEFAULT_RETRIES=0)
+class GoogleClientWithRequestTestCase(SimpleTestCase):
+    def setUp(self):
+        GoogleClientWithRequest._account_info_cache = None
+
+    def test_should_cache_google_account_info(self):
+        with StubServer([(200, google_account_info)]) as server, self._stub_google(server):
+            first_account_info = GoogleClientWithRequest._get_google_account_info('o_auth_token')
+            second_account_info = GoogleClientWithRequest._get_google_account_info('o_auth_token')
+
+        assert_that(first_account_info).is_equal_to(google_account_info)
+        assert_that(second_account_info).is_equal_to(google_account_info)
+        assert_that(server.requests).is_length(1)
+        assert_that(GoogleClientWithRequest.account_info_cache().metrics()).is_equal_to({
+            'hits': 1,
+            'misses': 1,
+            'coalesced': 0,
+            'hit_rate': 0.5,
+        })
+
+    def test_should_coalesce_concurrent_requests_with_same_token(self):
+        concurrency = 5
+        barrier = threading.Barrier(concurrency)
+        results = []
+
+        def login():
+            barrier.wait()
+            results.append(GoogleClientWithRequest._get_google_account_info('o_auth_token'))
+
+        with StubServer([(200, google_account_info)], delay=0.2) as server, self._stub_google(server):
+            threads = [threading.Thread(target=login) for _ in range(concurrency)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert_that(results).is_equal_to([google_account_info] * concurrency)
+        assert_that(server.requests).is_length(1)
+        assert_that(GoogleClientWithRequest.account_info_cache().metrics()['coalesced']).is_equal_to(concurrency - 1)
+
+    def test_should_not_cache_failed_verification(self):
+        with StubServer([(401, {}), (200, google_account_info)]) as server, self._stub_google(server):
+            with self.assertRaises(ValidationError):
+                GoogleClientWithRequest._get_google_account_info('o_auth_token')
+
+            account_info = GoogleClientWithRequest._get_google_account_info('o_auth_token')
+
+        assert_that(account_info).is_equal_to(google_account_info)
+        assert_that(server.requests).is_length(2)
+
+    @staticmethod
+    def _stub_google(server):
+        return mock.patch.object(GoogleClientWithRequest, 'GOOGLE_GET_EMAIL_URL', f'{server.url}/oauth2/v2/userinfo')
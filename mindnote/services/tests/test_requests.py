@@ -0,0 +1,59 @@
+import asyncio
+
+from assertpy import assert_that
+from django.test import SimpleTestCase, override_settings
+
+from services.exceptions import ExternalRequestServerError, ExternalRequestClientError
+from services.requests import RequestWithHttp, AsyncRequestWithHttp
+from services.tests.stub_server import StubServer
+
+
+@override_settings(DEFAULT_RETRIES=2, DEFAULT_RETRY_BACKOFF=0)
+class RequestWithHttpTestCase(SimpleTestCase):
+    def test_should_retry_server_error(self):
+        with StubServer([(503, {}), (503, {}), (200, {'ok': True})]) as server:
+            response = RequestWithHttp().get(f'{server.url}/resource')
+
+        assert_that(response.json()).is_equal_to({'ok': True})
+        assert_that(server.requests).is_length(3)
+
+    def test_should_raise_when_retries_are_exhausted(self):
+        with StubServer([(500, {})]) as server:
+            with self.assertRaises(ExternalRequestServerError):
+                RequestWithHttp().get(f'{server.url}/resource')
+
+        assert_that(server.requests).is_length(3)
+
+    def test_should_not_retry_client_error(self):
+        with StubServer([(404, {})]) as server:
+            with self.assertRaises(ExternalRequestClientError):
+                RequestWithHttp().get(f'{server.url}/resource')
+
+        assert_that(server.requests).is_length(1)
+
+    def test_should_not_retry_post_by_default(self):
+        with StubServer([(503, {}), (200, {})]) as server:
+            with self.assertRaises(ExternalRequestServerError):
+                RequestWithHttp().post(f'{server.url}/resource', json={})
+
+        assert_that(server.requests).is_length(1)
+
+    def test_should_reuse_session(self):
+        assert_that(RequestWithHttp.get_session()).is_same_as(RequestWithHttp.get_session())
+
+    def test_should_not_share_cookies_between_requests(self):
+        with StubServer([(200, {})], headers={'Set-Cookie': 'session=user-1; Path=/'}) as server:
+            RequestWithHttp().get(f'{server.url}/resource')
+            RequestWithHttp().get(f'{server.url}/resource')
+
+        assert_that(server.request_headers[1]).does_not_contain_key('Cookie')
+
+
+@override_settings(DEFAULT_RETRIES=2, DEFAULT_RETRY_BACKOFF=0)
+class AsyncRequestWithHttpTestCase(SimpleTestCase):
+    def test_should_retry_server_error(self):
+        with StubServer([(502, {}), (200, {'ok': True})]) as server:
+            response = asyncio.run(AsyncRequestWithHttp().get(f'{server.url}/resource'))
+
+        assert_that(response.json()).is_equal_to({'ok': True})
+        assert_that(server.requests).is_length(2)
@@ -0,0 +1,106 @@
+import hashlib
+import pickle
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from commons.caches import LRUCache
+
+
+class TokenCache(ABC):
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if TokenCache._instance is None:
+            options = settings.TOKEN_AUTHENTICATION_CACHE
+
+            if options['BACKEND'] == 'django':
+                TokenCache._instance = TokenCacheWithDjangoCache(options)
+            else:
+                TokenCache._instance = TokenCacheWithLocalMemory(options)
+
+        return TokenCache._instance
+
+    @classmethod
+    def reset(cls):
+        TokenCache._instance = None
+
+    @abstractmethod
+    def get(self, key):
+        pass
+
+    @abstractmethod
+    def set(self, key, token):
+        pass
+
+    @abstractmethod
+    def delete_many(self, keys):
+        pass
+
+
+class TokenCacheWithLocalMemory(TokenCache):
+    def __init__(self, options):
+        self.cache = LRUCache(max_size=options['MAX_SIZE'], timeout=options['TIMEOUT'])
+
+    def get(self, key):
+        # tokens are kept pickled like django's cache backends do, so concurrent requests never share a user instance
+        pickled_token = self.cache.get(key)
+
+        return pickle.loads(pickled_token) if pickled_token is not None else None
+
+    def set(self, key, token):
+        self.cache.set(key, pickle.dumps(token, pickle.HIGHEST_PROTOCOL))
+
+    def delete_many(self, keys):
+        for key in keys:
+            self.cache.delete(key)
+
+
+class TokenCacheWithDjangoCache(TokenCache):
+    KEY_PREFIX = 'token-authentication'
+
+    def __init__(self, options):
+        self.cache = caches[options['CACHE_ALIAS']]
+        self.timeout = options['TIMEOUT']
+
+    def get(self, key):
+        return self.cache.get(self._get_cache_key(key))
+
+    def set(self, key, token):
+        self.cache.set(self._get_cache_key(key), token, self.timeout)
+
+    def delete_many(self, keys):
+        self.cache.delete_many([self._get_cache_key(key) for key in keys])
+
+    def _get_cache_key(self, key):
+        return f'{self.KEY_PREFIX}:{hashlib.sha256(key.encode()).hexdigest()}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def authenticate_credentials(self, key):
+        token_cache = TokenCache.instance()
+
+        token = token_cache.get(key)
+        if token is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(key, token)
+
+            return user, token
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return token.user, token
+
+
+@receiver(setting_changed)
+def reset_token_cache(setting, **kwargs):
+    if setting == 'TOKEN_AUTHENTICATION_CACHE':
+        TokenCache.reset()
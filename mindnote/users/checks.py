@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.checks import Warning, register, Tags
+
+SHARED_CACHE_WARNING_ID = 'users.W001'
+
+
+@register(Tags.caches, deploy=True)
+def check_token_authentication_cache(app_configs, **kwargs):
+    options = settings.TOKEN_AUTHENTICATION_CACHE
+    if options['BACKEND'] == 'django' and 'LocMemCache' not in settings.CACHES[options['CACHE_ALIAS']]['BACKEND']:
+        return []
+
+    return [Warning(
+        'TOKEN_AUTHENTICATION_CACHE is kept per process, so a deleted token or a deactivated user is still '
+        'authenticated by the other worker processes until the cached token expires.',
+        hint="Use the 'django' BACKEND with a CACHES entry shared by every worker process.",
+        id=SHARED_CACHE_WARNING_ID,
+    )]
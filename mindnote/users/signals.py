@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from users.authentication import TokenCache
+from users.models import User
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, **kwargs):
+    TokenCache.instance().delete_many([instance.key])
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user_tokens(sender, instance, created, **kwargs):
+    if created:
+        return
+
+    TokenCache.instance().delete_many(Token.objects.filter(user_id=instance.id).values_list('key', flat=True))
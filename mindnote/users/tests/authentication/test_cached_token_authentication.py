@@ -0,0 +1,91 @@
+from assertpy import assert_that
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.authentication import CachedTokenAuthentication
+from users.checks import check_token_authentication_cache, SHARED_CACHE_WARNING_ID
+
+
+class CachedTokenAuthenticationTestCase(APITestCase):
+    def test_should_authenticate_without_query_when_token_is_cached(self):
+        user = baker.make('users.User')
+        token = user.get_token()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        with self.assertNumQueries(1):
+            first_response = self.client.get('/users/my-profile/')
+        with self.assertNumQueries(0):
+            second_response = self.client.get('/users/my-profile/')
+
+        assert_that(first_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(second_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(second_response.data['id']).is_equal_to(user.id)
+
+    @override_settings(TOKEN_AUTHENTICATION_CACHE={
+        'BACKEND': 'django',
+        'CACHE_ALIAS': 'default',
+        'TIMEOUT': 60,
+        'MAX_SIZE': 10000,
+    })
+    def test_should_authenticate_without_query_when_token_is_cached_in_django_cache(self):
+        user = baker.make('users.User')
+        token = user.get_token()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        with self.assertNumQueries(1):
+            first_response = self.client.get('/users/my-profile/')
+        with self.assertNumQueries(0):
+            second_response = self.client.get('/users/my-profile/')
+
+        assert_that(first_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(second_response.status_code).is_equal_to(status.HTTP_200_OK)
+        assert_that(second_response.data['id']).is_equal_to(user.id)
+
+    def test_should_not_authenticate_when_cached_token_is_deleted(self):
+        user = baker.make('users.User')
+        token = user.get_token()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.client.get('/users/my-profile/')
+
+        token.delete()
+        response = self.client.get('/users/my-profile/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_401_UNAUTHORIZED)
+
+    def test_should_not_authenticate_when_cached_user_is_deactivated(self):
+        user = baker.make('users.User')
+        token = user.get_token()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.client.get('/users/my-profile/')
+
+        user.is_active = False
+        user.save()
+        response = self.client.get('/users/my-profile/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_401_UNAUTHORIZED)
+
+    def test_should_not_share_cached_user_between_requests(self):
+        token = baker.make('users.User').get_token()
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(token.key)
+
+        first_user, _ = authentication.authenticate_credentials(token.key)
+        second_user, _ = authentication.authenticate_credentials(token.key)
+
+        assert_that(first_user).is_equal_to(second_user)
+        assert_that(first_user).is_not_same_as(second_user)
+
+    def test_should_warn_per_process_token_cache_on_deploy_check(self):
+        warning_ids = [warning.id for warning in check_token_authentication_cache(None)]
+
+        assert_that(warning_ids).is_equal_to([SHARED_CACHE_WARNING_ID])
+
+    @override_settings(
+        TOKEN_AUTHENTICATION_CACHE={'BACKEND': 'django', 'CACHE_ALIAS': 'default', 'TIMEOUT': 60, 'MAX_SIZE': 10000},
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                            'LOCATION': '/tmp/mindnote-test-cache'}},
+    )
+    def test_should_not_warn_shared_token_cache_on_deploy_check(self):
+        assert_that(check_token_authentication_cache(None)).is_empty()
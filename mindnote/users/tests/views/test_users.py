@@ -7,6 +7,7 @@ from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.test import APITestCase
 
+from articles.models import Article, Note, Connection, Tombstone
 from services.google import GoogleClientWithTest
 from users.models import User
 
@@ -135,6 +136,59 @@ class UserViewSetTestCase(APITestCase):
         assert_that(response.status_code).is_equal_to(status.HTTP_400_BAD_REQUEST)
         assert_that(response.data[0]).is_equal_to('Failed to get google account information with o auth token')
 
+    def test_should_delete_with_articles(self):
+        user = baker.make('users.User')
+        user.get_token()
+        articles = baker.make('articles.Article', user=user, _quantity=2)
+        notes = baker.make('articles.Note', article=articles[0], _quantity=3)
+        baker.make('articles.Connection', article=articles[0], left_note=notes[0], right_note=notes[1])
+        baker.make('articles.Tombstone', article=articles[1])
+        another_article = baker.make('articles.Article')
+        baker.make('articles.Note', article=another_article)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.delete(f'/users/{user.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_204_NO_CONTENT)
+        assert_that(User.objects.filter(id=user.id).exists()).is_false()
+        assert_that(Token.objects.filter(user_id=user.id).exists()).is_false()
+        assert_that(Article.objects.filter(user_id=user.id).exists()).is_false()
+        assert_that(Note.objects.filter(article__in=articles).exists()).is_false()
+        assert_that(Connection.objects.filter(article__in=articles).exists()).is_false()
+        assert_that(Tombstone.objects.filter(article__in=articles).exists()).is_false()
+        assert_that(Note.objects.filter(article=another_article).exists()).is_true()
+
+    def test_should_update_only_self(self):
+        user = baker.make('users.User', name='origin name')
+        another_user = baker.make('users.User')
+
+        self.client.force_authenticate(user=another_user)
+        response = self.client.patch(f'/users/{user.id}/', data=json.dumps({'name': 'changed name'}),
+                                     content_type='application/json')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
+        assert_that(User.objects.get(id=user.id).name).is_equal_to('origin name')
+
+    def test_should_not_delete_unauthorized(self):
+        user = baker.make('users.User')
+
+        response = self.client.delete(f'/users/{user.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_401_UNAUTHORIZED)
+        assert_that(User.objects.filter(id=user.id).exists()).is_true()
+
+    def test_should_not_delete_forbidden(self):
+        user = baker.make('users.User')
+        article = baker.make('articles.Article', user=user)
+        another_user = baker.make('users.User')
+
+        self.client.force_authenticate(user=another_user)
+        response = self.client.delete(f'/users/{user.id}/')
+
+        assert_that(response.status_code).is_equal_to(status.HTTP_403_FORBIDDEN)
+        assert_that(User.objects.filter(id=user.id).exists()).is_true()
+        assert_that(Article.objects.filter(id=article.id).exists()).is_true()
+
     @staticmethod
     def _assert_user(response_user, expect_user):
         assert_that(response_user['id']).is_equal_to(expect_user.id)
@@ -1,7 +1,7 @@
 from django.contrib.auth import authenticate
 from django.db import transaction
 from django_rest_framework_mango.mixins import PermissionMixin
-from rest_framework import viewsets, status
+from rest_framework import viewsets, status, permissions
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import action
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
@@ -9,11 +9,18 @@ from rest_framework.mixins import UpdateModelMixin, DestroyModelMixin
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from articles.changes import delete_articles
+from articles.models import Article
 from services.google import GoogleClient
 from users.models import User
 from users.serializers import UserSerializer, TokenSerializer
 
 
+class IsSelf(permissions.BasePermission):
+    def has_object_permission(self, request, views, obj):
+        return obj.id == request.user.id
+
+
 class UserViewSet(
     PermissionMixin,
     UpdateModelMixin, DestroyModelMixin,
@@ -25,6 +32,9 @@ class UserViewSet(
         'create': (AllowAny,),
         'tokens': (AllowAny,),
         'my_profile': (IsAuthenticated,),
+        'update': (IsAuthenticated, IsSelf),
+        'partial_update': (IsAuthenticated, IsSelf),
+        'destroy': (IsAuthenticated, IsSelf),
     }
 
     @transaction.atomic()
@@ -42,6 +52,11 @@ class UserViewSet(
 
         return Response(response_data, status=status.HTTP_201_CREATED)
 
+    @transaction.atomic()
+    def perform_destroy(self, instance):
+        delete_articles(Article.objects.filter(user=instance).values_list('id', flat=True))
+        instance.delete()
+
     @action(detail=False, methods=['post'])
     def tokens(self, request, *args, **kwargs):
         user = authenticate(username=request.data['email'], password=request.data['password'])